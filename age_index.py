@@ -0,0 +1,64 @@
+from __future__ import annotations
+from algorithms.binary_search import binary_search
+from algorithms.mergesort import mergesort
+from data_structures.referential_array import ArrayR
+from player import Player
+from typing import Collection
+
+
+class AgeIndex:
+    """
+    Players sorted by birth year, so players in an age range can be found with two binary searches.
+
+    Birth years never change, so the index stays valid as years pass; only the query reads the clock.
+    """
+
+    def __init__(self, players: Collection[Player]) -> None:
+        """
+        Args:
+            players (Collection[Player]): The players to index.
+
+        Complexity:
+            Best Case Complexity: O(N * log(N)), where N is the number of players
+            Worst Case Complexity: O(N * log(N)), same as best case
+        """
+        self.players = ArrayR(len(players))
+        for i in range(len(players)):
+            self.players[i] = players[i]
+        self.players = mergesort(self.players, key=lambda player: player.birth_year)
+        self.birth_years = ArrayR(len(self.players))
+        for i in range(len(self.players)):
+            self.birth_years[i] = self.players[i].birth_year
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def between(self, min_age: int, max_age: int) -> ArrayR[Player]:
+        """
+        Returns the players whose age is between `min_age` and `max_age` inclusive, youngest first.
+
+        Complexity:
+            Best Case Complexity: O(log(N) + M), where N is the number of players and M the number returned
+            Worst Case Complexity: O(log(N) + M), same as best case
+        """
+        current_year = Player.clock.current_year()
+        start = self.__first_at_least(current_year - max_age)
+        end = self.__first_at_least(current_year - min_age + 1)
+        res = ArrayR(max(end - start, 0))
+        for i in range(start, end):
+            res[end - 1 - i] = self.players[i]
+        return res
+
+    def __first_at_least(self, birth_year: int) -> int:
+        """
+        Returns the first position whose birth year is at least `birth_year`.
+        Birth years are integers, so searching half a year earlier never finds an exact match and
+        binary search stops at the insertion point instead.
+
+        Complexity:
+            Best Case Complexity: O(log(N)), where N is the number of players
+            Worst Case Complexity: O(log(N)), same as best case
+        """
+        if len(self.birth_years) == 0:
+            return 0
+        return binary_search(self.birth_years, birth_year - 0.5)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+from array import array
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
+from math import gcd
+from random_gen import RandomGen, RandomStream
+from typing import Collection, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """
+    Discrete distribution over a fixed set of outcomes, sampled in O(1) with Walker's alias method.
+
+    The table has one column per outcome. Every column is worth the same probability and holds a threshold
+    and an alias: a draw picks a column and a coin, and returns the column's own outcome if the coin is
+    under the threshold, or the alias outcome otherwise.
+
+    Weights are kept as integers (divided by their greatest common divisor), so the table is exact.
+    One `random()` draw picks the column; only a column that is not full needs a second draw for the coin,
+    which is scaled to the column's units rather than reduced modulo them, so it is unbiased for any weights.
+    With equal weights every column is full, and sampling returns `outcomes[random() % n]`, exactly like
+    `RandomGen.random_choice`.
+    """
+
+    # Fractional weights are rounded to multiples of 1 / FLOAT_SCALE
+    FLOAT_SCALE = 1 << 20
+    # Number of bits in a `RandomGen.random()` draw
+    DRAW_BITS = 32
+
+    def __init__(self, outcomes: Collection[T], weights: Collection[int | float]) -> None:
+        """
+        Args:
+            outcomes (Collection[T]): The values the distribution can return. The collection is not copied.
+            weights (Collection[int | float]): The relative weight of each outcome
+
+        Raises:
+            ValueError: if the lengths differ, a weight is negative, or every weight is 0
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of outcomes
+            Worst Case Complexity: O(N), same as best case
+        """
+        if len(outcomes) != len(weights):
+            raise ValueError("There should be one weight per outcome.")
+        n = len(weights)
+        scaled = array("Q", bytes(8 * n))
+        is_integral = True
+        for i in range(n):
+            if weights[i] < 0:
+                raise ValueError("Weights cannot be negative.")
+            is_integral = is_integral and weights[i] == int(weights[i])
+        divisor = 0
+        for i in range(n):
+            scaled[i] = int(weights[i]) if is_integral else round(weights[i] * self.FLOAT_SCALE)
+            divisor = gcd(divisor, scaled[i])
+        if divisor == 0:
+            raise ValueError("At least one weight should be positive.")
+
+        # Every column holds `total` units; outcome i needs weight * n of them in all
+        total = 0
+        for i in range(n):
+            scaled[i] //= divisor
+            total += scaled[i]
+            scaled[i] *= n
+        self.outcomes = outcomes
+        self.total = total
+        self.__span = n * total
+        self.__thresholds = array("Q", bytes(8 * n))
+        self.__aliases = array("Q", range(n))
+
+        small = ArrayList(n)
+        large = ArrayList(n)
+        for i in range(n):
+            (small if scaled[i] < total else large).append(i)
+        while len(small) > 0 and len(large) > 0:
+            short = small.delete_at_index(len(small) - 1)
+            tall = large.delete_at_index(len(large) - 1)
+            self.__thresholds[short] = scaled[short]
+            self.__aliases[short] = tall
+            # The tall outcome fills the rest of the short column
+            scaled[tall] -= total - scaled[short]
+            (small if scaled[tall] < total else large).append(tall)
+        # What is left is exactly full, as the units always add up to n * total
+        for stack in (small, large):
+            for i in range(len(stack)):
+                self.__thresholds[stack[i]] = total
+
+    @classmethod
+    def uniform(cls, outcomes: Collection[T]) -> AliasTable[T]:
+        """
+        Creates a table where every outcome is equally likely.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of outcomes
+            Worst Case Complexity: O(N), same as best case
+        """
+        weights = ArrayR(len(outcomes))
+        for i in range(len(outcomes)):
+            weights[i] = 1
+        return cls(outcomes, weights)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of outcomes.
+        """
+        return len(self.outcomes)
+
+    def columns(self) -> tuple[array, array]:
+        """
+        Returns the thresholds and aliases of the table's columns, e.g. to sample it in bulk elsewhere.
+        Each column is worth `total` units; the arrays are shared with the table and must not be changed.
+        """
+        return self.__thresholds, self.__aliases
+
+    def probability(self, index: int) -> float:
+        """
+        Returns the probability of the outcome at `index`.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of outcomes
+            Worst Case Complexity: O(N), same as best case
+        """
+        n = len(self.outcomes)
+        units = self.__thresholds[index]
+        for column in range(n):
+            if self.__aliases[column] == index and column != index:
+                units += self.total - self.__thresholds[column]
+        return units / self.__span
+
+    def sample_index(self, rng: RandomStream | None = None) -> int:
+        """
+        Draws the index of an outcome, using one `rng.random()` call, or two when the column drawn is not full.
+        `rng` defaults to `RandomGen.default`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if rng is None:
+            rng = RandomGen.default
+        column = rng.random() % len(self.outcomes)
+        threshold = self.__thresholds[column]
+        if threshold == self.total:
+            return column
+        # The coin is the draw scaled from 2^32 values down to the column's `total` units
+        if rng.random() * self.total < threshold << self.DRAW_BITS:
+            return column
+        return self.__aliases[column]
+
+    def sample(self, rng: RandomStream | None = None) -> T:
+        """
+        Draws an outcome, using one `rng.random()` call, or two when the column drawn is not full.
+        `rng` defaults to `RandomGen.default`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.outcomes[self.sample_index(rng)]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Callable
+import datetime
+import time
+
+
+def system_year() -> int:
+    """
+    Reads the current year from the system clock.
+    """
+    return datetime.datetime.now().year
+
+
+class Clock(ABC):
+    """
+    Source of the current year for age calculations.
+    """
+
+    @abstractmethod
+    def current_year(self) -> int:
+        """ Returns the current year. """
+        pass
+
+
+class SystemClock(Clock):
+    """
+    Clock that asks its year source every time it is read.
+    """
+
+    def __init__(self, year_source: Callable[[], int] = system_year) -> None:
+        """
+        Args:
+            year_source (Callable[[], int]): Function returning the current year.
+        """
+        self.__year_source = year_source
+
+    def current_year(self) -> int:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.__year_source()
+
+
+class CachedYearClock(Clock):
+    """
+    Clock that remembers the year and only asks its year source again once
+    `refresh_interval` seconds have passed since the last read of the source.
+    """
+
+    def __init__(self, year_source: Callable[[], int] = system_year, refresh_interval: float = 60.0,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            year_source (Callable[[], int]): Function returning the current year.
+            refresh_interval (float): Seconds a cached year stays valid for.
+            timer (Callable[[], float]): Monotonic timer used to measure the interval.
+        """
+        if refresh_interval < 0:
+            raise ValueError("Refresh interval cannot be negative.")
+        self.__year_source = year_source
+        self.__timer = timer
+        self.refresh_interval = refresh_interval
+        self.__year = 0
+        self.__expires_at = None
+
+    def current_year(self) -> int:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        now = self.__timer()
+        if self.__expires_at is None or now >= self.__expires_at:
+            self.__year = self.__year_source()
+            self.__expires_at = now + self.refresh_interval
+        return self.__year
+
+    def invalidate(self) -> None:
+        """
+        Forces the next read to ask the year source again.
+        """
+        self.__expires_at = None
+
+
+class FixedClock(Clock):
+    """
+    Clock that always reports the same year, e.g. to age a simulated league.
+    """
+
+    def __init__(self, year: int) -> None:
+        self.year = year
+
+    def current_year(self) -> int:
+        return self.year
@@ -6,7 +6,11 @@ from data_structures.linked_stack import LinkedStack
 from data_structures.circular_queue import CircularQueue
 from data_structures.hash_table_linear_probing import LinearProbeTable
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.hash_table_identity import IdentityProbeTable
+from data_structures.hash_table_integer import IntegerProbeTable
+from data_structures.enum_map import EnumMap
 from data_structures.array_set import ArraySet
 from data_structures.bit_vector_set import BitVectorSet
+from data_structures.enum_set import EnumSet
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.node import Node
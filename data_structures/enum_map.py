@@ -0,0 +1,136 @@
+from __future__ import annotations
+from enum import Enum
+from typing import TypeVar
+from data_structures.abstract_hash_table import HashTable
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K', bound=Enum)
+V = TypeVar('V')
+
+
+class EnumMap(HashTable[K, V]):
+    """
+    Map keyed by the members of one enum, stored in an array indexed by each member's ordinal.
+
+    The enum's members must have an `ordinal` attribute giving their position in definition order
+    (see enums.py). No hashing is needed, so every operation on a single key is O(1).
+    A bit mask records which keys are present, so None is a valid value.
+    """
+
+    def __init__(self, enum_type: type[K]) -> None:
+        """
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        self.__enum_type = enum_type
+        self.__members = ArrayR(len(enum_type.__members__))
+        for member in enum_type:
+            self.__members[member.ordinal] = member
+        self.__values = ArrayR(len(self.__members))
+        self.__present = 0
+        self.__length = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys in the map.
+        """
+        return self.__length
+
+    def __ordinal(self, key: K) -> int:
+        """
+        Returns the ordinal of `key`.
+        :raises KeyError: if the key is not a member of the map's enum.
+        """
+        if not isinstance(key, self.__enum_type):
+            raise KeyError(key)
+        return key.ordinal
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the map.
+        :complexity: O(1)
+        """
+        return isinstance(key, self.__enum_type) and (self.__present >> key.ordinal) & 1 == 1
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value associated with a key.
+        :raises KeyError: when the key is not in the map.
+        :complexity: O(1)
+        """
+        ordinal = self.__ordinal(key)
+        if not (self.__present >> ordinal) & 1:
+            raise KeyError(key)
+        return self.__values[ordinal]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set a (key, data) pair in the map.
+        :raises KeyError: if the key is not a member of the map's enum.
+        :complexity: O(1)
+        """
+        ordinal = self.__ordinal(key)
+        if not (self.__present >> ordinal) & 1:
+            self.__present |= 1 << ordinal
+            self.__length += 1
+        self.__values[ordinal] = data
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a key from the map.
+        :raises KeyError: when the key is not in the map.
+        :complexity: O(1)
+        """
+        ordinal = self.__ordinal(key)
+        if not (self.__present >> ordinal) & 1:
+            raise KeyError(key)
+        self.__present &= ~(1 << ordinal)
+        self.__values[ordinal] = None
+        self.__length -= 1
+
+    def is_empty(self) -> bool:
+        return self.__length == 0
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the map, in ordinal order.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        res = ArrayR(self.__length)
+        i = 0
+        for ordinal in range(len(self.__members)):
+            if (self.__present >> ordinal) & 1:
+                res[i] = self.__members[ordinal]
+                i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the map, in the ordinal order of their keys.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        res = ArrayR(self.__length)
+        i = 0
+        for ordinal in range(len(self.__members)):
+            if (self.__present >> ordinal) & 1:
+                res[i] = self.__values[ordinal]
+                i += 1
+        return res
+
+    def __iter__(self):
+        """
+        Iterates over the values in the map, in the ordinal order of their keys.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        for ordinal in range(len(self.__members)):
+            if (self.__present >> ordinal) & 1:
+                yield self.__values[ordinal]
+
+    def __str__(self) -> str:
+        result = ""
+        for ordinal in range(len(self.__members)):
+            if (self.__present >> ordinal) & 1:
+                result += "(" + str(self.__members[ordinal]) + "," + str(self.__values[ordinal]) + ")\n"
+        return result
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+from enum import Enum
+from typing import TypeVar
+from data_structures.abstract_set import Set
+from data_structures.referential_array import ArrayR
+
+T = TypeVar('T', bound=Enum)
+
+
+class EnumSet(Set[T]):
+    """
+    A bit-vector set of the members of one enum. A member is in the set if and only if
+    the bit at its ordinal is 1.
+
+    The enum's members must have an `ordinal` attribute giving their position in definition order
+    (see enums.py).
+    """
+
+    def __init__(self, enum_type: type[T]) -> None:
+        self.__enum_type = enum_type
+        self.__elems = 0
+
+    @classmethod
+    def of(cls, enum_type: type[T], *members: T) -> EnumSet[T]:
+        """ Creates a set of the given members. """
+        res = cls(enum_type)
+        for member in members:
+            res.add(member)
+        return res
+
+    @classmethod
+    def all_of(cls, enum_type: type[T]) -> EnumSet[T]:
+        """ Creates a set of every member of the enum. """
+        res = cls(enum_type)
+        res.__elems = (1 << len(enum_type.__members__)) - 1
+        return res
+
+    def __check(self, item: T) -> None:
+        """
+        :raises TypeError: if the item is not a member of the set's enum.
+        """
+        if not isinstance(item, self.__enum_type):
+            raise TypeError(f"Set elements should be members of {self.__enum_type.__name__}.")
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.__elems = 0
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return self.__elems == 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the set.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        return self.__elems.bit_count()
+
+    def __contains__(self, item: T) -> bool:
+        """
+        True if the set contains the item. False otherwise.
+        :complexity: O(1)
+        """
+        return isinstance(item, self.__enum_type) and (self.__elems >> item.ordinal) & 1 == 1
+
+    def add(self, item: T) -> None:
+        """
+        Adds an element to the set.
+        :raises TypeError: if the item is not a member of the set's enum.
+        """
+        self.__check(item)
+        self.__elems |= 1 << item.ordinal
+
+    def remove(self, item: T) -> None:
+        """
+        Removes an element from the set.
+        :raises TypeError: if the item is not a member of the set's enum.
+        :raises KeyError: if the item is not in the set.
+        """
+        self.__check(item)
+        if item not in self:
+            raise KeyError(item)
+        self.__elems &= ~(1 << item.ordinal)
+
+    def values(self) -> ArrayR[T]:
+        """
+        Returns the elements of the set as an array, in ordinal order.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        res = ArrayR(len(self))
+        i = 0
+        for member in self.__enum_type:
+            if (self.__elems >> member.ordinal) & 1:
+                res[i] = member
+                i += 1
+        return res
+
+    def __iter__(self):
+        """
+        Iterates over the elements of the set, in ordinal order.
+        :complexity: O(M) where M is the number of members of the enum.
+        """
+        for member in self.__enum_type:
+            if (self.__elems >> member.ordinal) & 1:
+                yield member
+
+    def union(self, other: EnumSet[T]) -> EnumSet[T]:
+        """ Creates the union of the set with another one. """
+        res = EnumSet(self.__enum_type)
+        res.__elems = self.__elems | other.__elems
+        return res
+
+    def intersection(self, other: EnumSet[T]) -> EnumSet[T]:
+        """ Creates the intersection of the set with another one. """
+        res = EnumSet(self.__enum_type)
+        res.__elems = self.__elems & other.__elems
+        return res
+
+    def difference(self, other: EnumSet[T]) -> EnumSet[T]:
+        """ Creates the difference of the set with another one, i.e. self - other. """
+        res = EnumSet(self.__enum_type)
+        res.__elems = self.__elems & ~other.__elems
+        return res
+
+    def __str__(self) -> str:
+        """ Construct a nice string representation. """
+        return '{' + ', '.join(member.name for member in self) + '}'
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from typing import TypeVar
+from data_structures.hash_table_linear_probing import LinearProbeTable
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class IdentityProbeTable(LinearProbeTable[V]):
+    """
+    Linear Probe Table keyed by object identity.
+
+    Keys are hashed by `id`, so any object can be a key in O(1) without hashing its contents.
+    Keys are still compared with ==, so this is meant for objects that use the default identity
+    equality (e.g. players and teams).
+    """
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key by its identity.
+        :complexity: O(1)
+        """
+        return id(key) % self.table_size
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from typing import TypeVar
+from data_structures.hash_table_linear_probing import LinearProbeTable
+
+V = TypeVar('V')
+
+
+class IntegerProbeTable(LinearProbeTable[V]):
+    """
+    Linear Probe Table keyed by non-negative integers.
+
+    Keys are hashed by their value, so each key is hashed in O(1) rather than digit by digit.
+    Consecutive keys land in consecutive positions, which suits keys that are indices.
+    """
+
+    def hash(self, key: int) -> int:
+        """
+        Hash a key by its value.
+        :complexity: O(1)
+        """
+        return key % self.table_size
@@ -11,6 +11,10 @@ class TeamGameResult(IntEnum):
     DRAW = 1
     LOSS = 0
 
+    def __init__(self, *args) -> None:
+        # Position of the member in definition order, usable as an array index
+        self.ordinal = len(type(self)._member_names_)
+
 
 class PlayerPosition(Enum):
     """
@@ -21,3 +25,7 @@ class PlayerPosition(Enum):
     DEFENDER = "Defender"
     MIDFIELDER = "Midfielder"
     STRIKER = "Striker"
+
+    def __init__(self, *args) -> None:
+        # Position of the member in definition order, usable as an array index
+        self.ordinal = len(type(self)._member_names_)
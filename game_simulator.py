@@ -1,38 +1,184 @@
 from __future__ import annotations
+from array import array
+from alias_table import AliasTable
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
-from enums import PlayerPosition
 from player import Player
-from random_gen import RandomGen
+from random_gen import RandomGen, RandomStream
 from team import Team
+from typing import Collection, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from poisson_goal_model import PoissonGoalModel
 
 
 class GameSimulationOutcome:
-    def __init__(self, home_goals: int, away_goals: int, goal_scorers: ArrayList[str]):
+    # Millions of outcomes are created in a Monte Carlo run, so they are kept free of a per-instance __dict__
+    __slots__ = ("home_goals", "away_goals", "home_scorers", "away_scorers", "home_roster", "away_roster")
+
+    SCORER_TYPECODE = "I"
+    SCORER_SIZE = array(SCORER_TYPECODE).itemsize
+
+    def __init__(self, home_goals: int, away_goals: int, home_scorers: array, away_scorers: array,
+                 home_roster: ArrayR[Player], away_roster: ArrayR[Player]):
         """
         Constructor for the GameResults class
 
         Args:
             home_goals (int): The number of goals scored by the home team
             away_goals (int): The number of goals scored by the away team
-            goal_scorers (ArrayList[str]): A list of the goal scorers in the game
+            home_scorers (array): For each home goal, the position of its scorer in `home_roster`
+            away_scorers (array): For each away goal, the position of its scorer in `away_roster`
+            home_roster (ArrayR[Player]): The players the home scorers were drawn from
+            away_roster (ArrayR[Player]): The players the away scorers were drawn from
 
         Returns:
             None
         """
         self.home_goals: int = home_goals
         self.away_goals: int = away_goals
-        self.goal_scorers: ArrayList[str] = goal_scorers
+        self.home_scorers: array = home_scorers
+        self.away_scorers: array = away_scorers
+        self.home_roster: ArrayR[Player] = home_roster
+        self.away_roster: ArrayR[Player] = away_roster
 
         # You see how redundant the code above is? We take the argument, we set it on the object exactly as it is,
         # without even changing its name or anything. That's what dataclasses are for, as you can see in season.py.
         # We didn't use them for this class, so you can compare the two approaches.
 
+    def scorers(self) -> ArrayR[Player]:
+        """
+        The goal scorers in the game, one per goal, home scorers first.
+
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of goals
+            Worst Case Complexity: O(G), same as best case
+        """
+        res = ArrayR(self.home_goals + self.away_goals)
+        for i in range(self.home_goals):
+            res[i] = self.home_roster[self.home_scorers[i]]
+        for i in range(self.away_goals):
+            res[self.home_goals + i] = self.away_roster[self.away_scorers[i]]
+        return res
+
+    @property
+    def scorer_ids(self) -> ArrayList[int]:
+        """
+        The registry ids of the goal scorers in the game, one per goal, home scorers first.
+
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of goals
+            Worst Case Complexity: O(G), same as best case
+        """
+        scorers = self.scorers()
+        res = ArrayList[int](max(len(scorers), 1))
+        for i in range(len(scorers)):
+            res.append(scorers[i].player_id)
+        return res
+
+    @property
+    def goal_scorers(self) -> ArrayList[str]:
+        """
+        The names of the goal scorers in the game, one per goal, home scorers first.
+
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of goals
+            Worst Case Complexity: O(G), same as best case
+        """
+        scorers = self.scorers()
+        res = ArrayList[str](max(len(scorers), 1))
+        for i in range(len(scorers)):
+            res.append(scorers[i].name)
+        return res
+
+
+class BatchSimulationOutcome:
+    """
+    Outcomes of a batch of games, stored as parallel arrays rather than one object per game.
+
+    Game `g` scored `home_goals[g]` and `away_goals[g]` goals. Its scorers are
+    `scorer_positions[scorer_offsets[g]:scorer_offsets[g + 1]]`, home scorers first, each the position of the
+    scorer in `home_rosters[g]` or `away_rosters[g]`: the arrays the scorers were drawn from, which are shared
+    with the teams' scorer tables rather than copied (None for a team that did not score).
+    """
+
+    TYPECODE = "Q"
+
+    def __init__(self, game_count: int) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of games
+            Worst Case Complexity: O(G), same as best case
+        """
+        self.home_goals = array("H", bytes(2 * game_count))
+        self.away_goals = array("H", bytes(2 * game_count))
+        self.home_rosters = ArrayR(game_count)
+        self.away_rosters = ArrayR(game_count)
+        self.scorer_positions = array(GameSimulationOutcome.SCORER_TYPECODE)
+        self.scorer_offsets = array(self.TYPECODE, bytes(array(self.TYPECODE).itemsize * (game_count + 1)))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the batch.
+        """
+        return len(self.home_goals)
+
+    @property
+    def scorer_ids(self) -> array:
+        """
+        The registry ids of every scorer in the batch, in the same order as `scorer_positions`.
+
+        Complexity:
+            Best Case Complexity: O(G + S), where G is the number of games and S the number of goals
+            Worst Case Complexity: O(G + S), same as best case
+        """
+        res = array(self.TYPECODE, bytes(array(self.TYPECODE).itemsize * len(self.scorer_positions)))
+        for game in range(len(self)):
+            start, middle = self.scorer_offsets[game], self.scorer_offsets[game] + self.home_goals[game]
+            for i in range(start, middle):
+                res[i] = self.home_rosters[game][self.scorer_positions[i]].player_id
+            for i in range(middle, self.scorer_offsets[game + 1]):
+                res[i] = self.away_rosters[game][self.scorer_positions[i]].player_id
+        return res
+
+    def outcome(self, game: int) -> GameSimulationOutcome:
+        """
+        Returns the outcome of game `game` as a standalone object, sharing the batch's rosters.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of goals in the game
+            Worst Case Complexity: O(S), same as best case
+        """
+        home_goals, away_goals = self.home_goals[game], self.away_goals[game]
+        start = self.scorer_offsets[game]
+        return GameSimulationOutcome(home_goals, away_goals,
+                                     self.scorer_positions[start:start + home_goals],
+                                     self.scorer_positions[start + home_goals:start + home_goals + away_goals],
+                                     self.home_rosters[game], self.away_rosters[game])
+
+
+def _goal_outcomes() -> ArrayR[int]:
+    """
+    The goals a team can score, repeated by how likely they are: 30 zeros, 30 ones, 20 twos, 10 threes, 5 fours and 5 fives.
+    """
+    counts = (30, 30, 20, 10, 5, 5)
+    res = ArrayR(sum(counts))
+    i = 0
+    for goals in range(len(counts)):
+        for _ in range(counts[goals]):
+            res[i] = goals
+            i += 1
+    return res
+
 
 class GameSimulator:
+    # Goals scored by a team, with a higher likelihood of low scores. A uniform table over the 100 repeated
+    # outcomes samples `outcomes[random() % 100]`, the same draws as picking from the list directly.
+    GOAL_DISTRIBUTION: AliasTable[int] = AliasTable.uniform(_goal_outcomes())
 
     @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> GameSimulationOutcome:
+    def simulate(home_team: Team, away_team: Team, goal_model: PoissonGoalModel | None = None,
+                 rng: RandomStream | None = None) -> GameSimulationOutcome:
         """
         Simulates a game between two teams, considering player stats for a more probabilistic outcome.
         Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
@@ -40,39 +186,105 @@ class GameSimulator:
         Args:
             home_team (Team): The home team.
             away_team (Team): The away team.
+            goal_model (PoissonGoalModel or None): Model to draw the goals from, instead of the teams' goal distributions.
+            rng (RandomStream or None): The random stream to draw from. Defaults to `RandomGen.default`.
 
         Returns:
             LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
                             'Goal Assists', 'Interceptions', 'Tacklers'
         """
-        # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
+        if rng is None:
+            rng = RandomGen.default
+        home_goals, away_goals = GameSimulator._draw_goals(home_team, away_team, goal_model, rng)
+        home_roster, home_scorers = GameSimulator._draw_scorers(home_team, home_goals, rng)
+        away_roster, away_scorers = GameSimulator._draw_scorers(away_team, away_goals, rng)
+        return GameSimulationOutcome(home_goals, away_goals, home_scorers, away_scorers, home_roster, away_roster)
 
-        # 2. Select goal scorers based on stats
-        goal_scorers = ArrayList[str]()
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
+    @staticmethod
+    def simulate_batch(fixtures: Collection, goal_model: PoissonGoalModel | None = None,
+                       rng: RandomStream | None = None) -> BatchSimulationOutcome:
+        """
+        Simulates a batch of games, e.g. a week or a whole season of fixtures.
+        The random draws are made in the same order as calling `simulate` on each fixture in turn,
+        so a seeded batch gives exactly the same results.
 
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.position != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.position != PlayerPosition.GOALKEEPER]
+        Args:
+            fixtures (Collection): The games to simulate, each with a `home_team` and an `away_team`,
+                such as the games of a `WeekOfGames`.
+            goal_model (PoissonGoalModel or None): Model to draw the goals from, instead of the teams' goal distributions.
+            rng (RandomStream or None): The random stream to draw from. Defaults to `RandomGen.default`.
 
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
+        Returns:
+            BatchSimulationOutcome: The outcome of every fixture, in the same order.
 
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
+        Complexity:
+            Best Case Complexity: O(G + S), where G is the number of games and S the number of goals scored,
+                when the teams' scorer tables are cached.
+            Worst Case Complexity: O(G + S + N), where N is the number of players whose teams' tables have to be rebuilt.
+        """
+        if rng is None:
+            rng = RandomGen.default
+        batch = BatchSimulationOutcome(len(fixtures))
+        for game in range(len(fixtures)):
+            fixture = fixtures[game]
+            home_goals, away_goals = GameSimulator._draw_goals(fixture.home_team, fixture.away_team, goal_model, rng)
+            batch.home_rosters[game] = GameSimulator._append_scorers(fixture.home_team, home_goals, batch.scorer_positions, rng)
+            batch.away_rosters[game] = GameSimulator._append_scorers(fixture.away_team, away_goals, batch.scorer_positions, rng)
+            batch.home_goals[game] = home_goals
+            batch.away_goals[game] = away_goals
+            batch.scorer_offsets[game + 1] = len(batch.scorer_positions)
+        return batch
+
+    @staticmethod
+    def _draw_goals(home_team: Team, away_team: Team, goal_model: PoissonGoalModel | None,
+                    rng: RandomStream) -> tuple[int, int]:
+        """
+        Draws the number of goals scored by the home and away teams, from the goal model if there is one,
+        or else each team's own distribution if it has one.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if goal_model is not None:
+            return goal_model.draw(home_team, away_team, rng)
+        home_goals: int = (home_team.goal_distribution or GameSimulator.GOAL_DISTRIBUTION).sample(rng)
+        away_goals: int = (away_team.goal_distribution or GameSimulator.GOAL_DISTRIBUTION).sample(rng)
+        return home_goals, away_goals
 
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+    @staticmethod
+    def _draw_scorers(team: Team, goals: int, rng: RandomStream) -> tuple[ArrayR[Player] | None, array]:
+        """
+        Draws the scorers of `goals` goals from the team's scorer table, which the team caches between roster changes.
+        Returns the players they were drawn from (None if there were no goals) and the position of each scorer
+        among them, in an array sized exactly to the number of goals.
 
-        for _ in range(home_goals):
-            scorer: Player = RandomGen.random_choice(home_outfield)
-            goal_scorers.append(scorer.name)
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of goals, when the team's scorer table is cached.
+            Worst Case Complexity: O(G + N), where N is the number of players in the team, when it has to be rebuilt.
+        """
+        scorers = array(GameSimulationOutcome.SCORER_TYPECODE, bytes(GameSimulationOutcome.SCORER_SIZE * goals))
+        # A team without outfield players has no table, which is only a problem if it scored
+        if goals == 0:
+            return None, scorers
+        table: AliasTable[Player] = team.scorer_table()
+        for i in range(goals):
+            scorers[i] = table.sample_index(rng)
+        return table.outcomes, scorers
 
-        for _ in range(away_goals):
-            scorer: Player = RandomGen.random_choice(away_outfield)
-            goal_scorers.append(scorer.name)
+    @staticmethod
+    def _append_scorers(team: Team, goals: int, scorer_positions: array, rng: RandomStream) -> ArrayR[Player] | None:
+        """
+        Draws the scorers of `goals` goals like `_draw_scorers`, appending their positions to `scorer_positions`.
+        Returns the players they were drawn from, or None if there were no goals.
 
-        return GameSimulationOutcome(home_goals, away_goals, goal_scorers)
+        Complexity:
+            Best Case Complexity: O(G), where G is the number of goals, when the team's scorer table is cached.
+            Worst Case Complexity: O(G + N), where N is the number of players in the team, when it has to be rebuilt.
+        """
+        if goals == 0:
+            return None
+        table: AliasTable[Player] = team.scorer_table()
+        for _ in range(goals):
+            scorer_positions.append(table.sample_index(rng))
+        return table.outcomes
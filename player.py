@@ -1,10 +1,41 @@
 from __future__ import annotations
+from array import array
+from clock import Clock, SystemClock
+from data_structures.abstract_hash_table import HashTable
+from data_structures.array_list import ArrayList
+from data_structures.referential_array import ArrayR
 from enums import PlayerPosition
+from player_registry import current_registry
+from stat_schema import STAT_SCHEMA
+from stats_store import StatsStore
+from typing import Collection
 import datetime
 
 
+def _current_year() -> int:
+    """
+    Reads the current year through this module's `datetime` import.
+    """
+    return datetime.datetime.now().year
+
+
 class Player:
-    def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
+    # Slots keep each player free of a per-instance __dict__, which matters when loading large leagues
+    __slots__ = (
+        "name", "birth_year", "position", "goals", "player_id",
+        "_stat_values", "_stat_stamps", "_stats_epoch", "_stats_store", "_stats_row",
+    )
+
+    # Source of the current year for every player, see `set_clock`
+    _DEFAULT_CLOCK: Clock = SystemClock(_current_year)
+    clock: Clock = _DEFAULT_CLOCK
+
+    # The last statistic name looked up by `player[statistic]` and its slot. Slots never change once interned,
+    # so code touching the same statistic on many players only hashes the name once.
+    _last_stat_name: str | None = None
+    _last_stat_slot: int = -1
+
+    def __init__(self, name: str, position: PlayerPosition, age: int, stats_store: StatsStore | None = None) -> None:
         """
         Constructor for the Player class
 
@@ -12,20 +43,58 @@ class Player:
             name (str): The name of the player
             position (PlayerPosition): The position of the player
             age (int): The age of the player
+            stats_store (StatsStore or None): A league-wide store to keep this player's stats in.
+                If None, the player keeps its own stats.
 
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(1)
+            Worst Case Complexity: O(N), where N is the number of registered players, when the registry has to grow
         """
         self.name = name
         # Calculate birth year based on current year and age
-        current_year = datetime.datetime.now().year
+        current_year = Player.clock.current_year()
         self.birth_year = current_year - age
         self.position = position
         self.goals = 0
-        # Initialize statistics storage using HashTableSeparateChaining
-        from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
-        self.stats = HashTableSeparateChaining()
+        # Stats are indexed by their slot in STAT_SCHEMA and only allocated once the first stat is set.
+        # Each slot also records the epoch it was written in (0 = never set); only the current epoch counts.
+        self._stat_values = None
+        self._stat_stamps = None
+        self._stats_epoch = 1
+        self._stats_store = stats_store
+        self._stats_row = stats_store.add_row() if stats_store is not None else -1
+        # Dense id in the current registry, see PlayerRegistry
+        self.player_id = -1
+        current_registry().register(self)
+
+    @property
+    def stats(self) -> PlayerStatsView:
+        """
+        A live view of the player's statistics, mapping each stat that has been set to its current value.
+        Writes through the view go to the player, like `player[statistic] = value`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return PlayerStatsView(self)
+
+    def _stat_slots(self) -> ArrayList[int]:
+        """
+        Returns the slots of the stats that have been set, in slot order.
+
+        Complexity:
+            Best Case Complexity: O(1), when no stat has been set
+            Worst Case Complexity: O(S), where S is the number of interned stat names
+        """
+        if self._stats_store is not None:
+            return self._stats_store.row_stat_slots(self._stats_row)
+        slots = ArrayList(max(len(STAT_SCHEMA), 1))
+        if self._stat_stamps is not None:
+            for slot in range(len(self._stat_stamps)):
+                if self._stat_stamps[slot] != 0:
+                    slots.append(slot)
+        return slots
 
     def reset_stats(self) -> None:
         """
@@ -34,13 +103,72 @@ class Player:
         This doesn't delete the existing stats, but resets them to 0.
         I.e. all stats that were previously set should still be available, with a value of 0.
 
+        Stats kept by the player itself are reset by starting a new epoch: values written in
+        an older epoch read as 0, so no entry has to be touched.
+
         Complexity:
-            Best Case Complexity: O(1), when there are no stats
-            Worst Case Complexity: O(N), where N is the number of statistics
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C), where C is the number of stat columns, when the stats are kept in a `StatsStore`
         """
-        stat_keys = self.stats.keys()
-        for i in range(len(stat_keys)):
-            self.stats[stat_keys[i]] = 0
+        if self._stats_store is not None:
+            self._stats_store.reset_row(self._stats_row)
+        else:
+            self._stats_epoch += 1
+            STAT_SCHEMA.mark_all_changed()
+
+    def stat(self, slot: int) -> int:
+        """
+        Get the value of the stat interned at `slot` in `STAT_SCHEMA`.
+
+        Raises:
+            KeyError: if the player never set the stat.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self._stats_store is not None:
+            return self._stats_store.get_slot(self._stats_row, slot)
+        stamps = self._stat_stamps
+        if stamps is None or slot < 0 or slot >= len(stamps) or stamps[slot] == 0:
+            raise KeyError(STAT_SCHEMA.name(slot) if 0 <= slot < len(STAT_SCHEMA) else slot)
+        return self._stat_values[slot] if stamps[slot] == self._stats_epoch else 0
+
+    def set_stat(self, slot: int, value: int) -> None:
+        """
+        Set the value of the stat interned at `slot` in `STAT_SCHEMA`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), where S is the number of interned stat names, when the storage has to grow
+        """
+        if self._stats_store is not None:
+            self._stats_store.set_slot(self._stats_row, slot, value)
+            return
+        if slot < 0 or slot >= len(STAT_SCHEMA):
+            raise IndexError(f"Stat slot {slot} is not in the schema.")
+        if self._stat_stamps is None or slot >= len(self._stat_stamps):
+            self.__grow_stats(len(STAT_SCHEMA))
+        self._stat_values[slot] = value
+        self._stat_stamps[slot] = self._stats_epoch
+        STAT_SCHEMA.mark_changed(slot)
+
+    def __grow_stats(self, capacity: int) -> None:
+        """
+        Grows the stat storage to hold `capacity` slots, keeping existing values.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the new capacity
+            Worst Case Complexity: O(S), same as best case
+        """
+        values = ArrayR(capacity)
+        stamps = array("Q", bytes(capacity * 8))
+        if self._stat_stamps is not None:
+            for slot in range(len(self._stat_stamps)):
+                values[slot] = self._stat_values[slot]
+                stamps[slot] = self._stat_stamps[slot]
+        self._stat_values = values
+        self._stat_stamps = stamps
 
     def __setitem__(self, statistic: str, value: int) -> None:
         """
@@ -52,9 +180,20 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(K), where K is the length of the statistic string
-            Worst Case Complexity: O(N * K), where N is the number of items in the stats table, K is the length of the statistic string
+            Worst Case Complexity: O(N * K), where N is the number of interned stat names, K is the length of the statistic string
         """
-        self.stats[statistic] = value
+        if statistic == Player._last_stat_name:
+            slot = Player._last_stat_slot
+        else:
+            slot = STAT_SCHEMA.slot(statistic)
+            Player._last_stat_name, Player._last_stat_slot = statistic, slot
+        stamps = self._stat_stamps
+        if self._stats_store is None and stamps is not None and slot < len(stamps):
+            self._stat_values[slot] = value
+            stamps[slot] = self._stats_epoch
+            STAT_SCHEMA.mark_changed(slot)
+        else:
+            self.set_stat(slot, value)
 
     def __getitem__(self, statistic: str) -> int:
         """
@@ -68,12 +207,25 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(K), where K is the length of the statistic string
-            Worst Case Complexity: O(N * K), where N is the number of items in the stats table, K is the length of the statistic string
+            Worst Case Complexity: O(N * K), where N is the number of interned stat names, K is the length of the statistic string
         """
-        try:
-            return self.stats[statistic]
-        except KeyError:
+        if statistic == Player._last_stat_name:
+            slot = Player._last_stat_slot
+        else:
+            try:
+                slot = STAT_SCHEMA.find(statistic)
+            except KeyError:
+                raise KeyError(statistic)
+            Player._last_stat_name, Player._last_stat_slot = statistic, slot
+        stamps = self._stat_stamps
+        if self._stats_store is None and stamps is not None and slot < len(stamps):
+            stamp = stamps[slot]
+            if stamp == self._stats_epoch:
+                return self._stat_values[slot]
+            if stamp != 0:
+                return 0
             raise KeyError(statistic)
+        return self.stat(slot)
 
     def get_age(self) -> int:
         """
@@ -86,8 +238,35 @@ class Player:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        current_year = datetime.datetime.now().year
-        return current_year - self.birth_year
+        return Player.clock.current_year() - self.birth_year
+
+    @classmethod
+    def set_clock(cls, clock: Clock | None = None) -> None:
+        """
+        Sets the clock all players read the current year from.
+        Pass e.g. a `CachedYearClock` to avoid reading the system clock on every age calculation,
+        or None to go back to reading the system clock every time.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        cls.clock = cls._DEFAULT_CLOCK if clock is None else clock
+
+    @staticmethod
+    def ages(players: Collection[Player]) -> ArrayR[int]:
+        """
+        Returns the ages of `players`, in the same order, reading the clock only once.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of players
+            Worst Case Complexity: O(N), same as best case
+        """
+        current_year = Player.clock.current_year()
+        res = ArrayR(len(players))
+        for i in range(len(players)):
+            res[i] = current_year - players[i].birth_year
+        return res
 
     def __str__(self) -> str:
         """
@@ -96,4 +275,97 @@ class Player:
         return f"Player(name={self.name}, position={self.position}, age={self.get_age()}, goals={self.goals})"
 
     def __repr__(self) -> str:
-        return str(self)
\ No newline at end of file
+        return str(self)
+
+
+class PlayerStatsView(HashTable[str, int]):
+    """
+    The statistics of one player as a hash table. The view holds no data of its own: reads and writes
+    go straight to the player, so it always shows the player's current stats.
+    Stats cannot be deleted, only reset with `Player.reset_stats`.
+    """
+
+    def __init__(self, player: Player) -> None:
+        self.__player = player
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stats that have been set.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of interned stat names
+            Worst Case Complexity: O(S), same as best case
+        """
+        return len(self.__player._stat_slots())
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns the names of the stats that have been set, in slot order.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of interned stat names
+            Worst Case Complexity: O(S), same as best case
+        """
+        slots = self.__player._stat_slots()
+        res = ArrayR(len(slots))
+        for i in range(len(slots)):
+            res[i] = STAT_SCHEMA.name(slots[i])
+        return res
+
+    def values(self) -> ArrayR[int]:
+        """
+        Returns the values of the stats that have been set, in the same order as `keys`.
+
+        Complexity:
+            Best Case Complexity: O(S), where S is the number of interned stat names
+            Worst Case Complexity: O(S), same as best case
+        """
+        slots = self.__player._stat_slots()
+        res = ArrayR(len(slots))
+        for i in range(len(slots)):
+            res[i] = self.__player.stat(slots[i])
+        return res
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks whether the player has set the stat `key`.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the key
+            Worst Case Complexity: O(N * K), where N is the number of interned stat names
+        """
+        try:
+            self.__player[key]
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: str) -> int:
+        """
+        Same as `player[key]`.
+        """
+        return self.__player[key]
+
+    def __setitem__(self, key: str, data: int) -> None:
+        """
+        Same as `player[key] = data`.
+        """
+        self.__player[key] = data
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Raises:
+            TypeError: always, as stats can only be reset.
+        """
+        raise TypeError("Player stats cannot be deleted, use Player.reset_stats instead.")
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def __str__(self) -> str:
+        keys = self.keys()
+        values = self.values()
+        result = ""
+        for i in range(len(keys)):
+            result += f"({keys[i]}, {values[i]})\n"
+        return result
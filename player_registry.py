@@ -0,0 +1,217 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from typing import Collection, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from player import Player
+
+
+class PlayerRegistry:
+    """
+    League-wide registry handing out dense integer ids to players.
+
+    Ids are given out in the order players are registered and never reused, so code can refer to a
+    player by its id and find it again by indexing an array. Registering only appends to that array.
+    The name index is built on the first `find`, and later finds only add the players registered since;
+    if several players share a name, the name refers to the first one registered.
+
+    The registry keeps its players alive. Players register in the current registry, which is
+    `PLAYER_REGISTRY` unless a `scoped_registry` is active, so short-lived runs can use one of their own.
+    """
+
+    INITIAL_CAPACITY = 16
+
+    # The name index starts at least this many times larger than the names in it, and doubles from there
+    INDEX_HEADROOM = 2
+    # The name index stops growing past this size, well beyond any league
+    MAX_INDEX_SIZE = 1 << 32
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        # Players by id, in an array that doubles when full
+        self.__players = ArrayR(self.INITIAL_CAPACITY)
+        self.__count = 0
+        self.__ids = None
+        # Players before this id are in the name index
+        self.__indexed = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of registered players.
+        """
+        return self.__count
+
+    def __contains__(self, player: Player) -> bool:
+        """
+        Checks whether `player` has been registered here.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        player_id = player.player_id
+        return 0 <= player_id < self.__count and self.__players[player_id] is player
+
+    def register(self, player: Player) -> int:
+        """
+        Gives `player` the next id and returns it. Registering a player again returns its existing id.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N), where N is the number of registered players, when the id array has to grow
+        """
+        player_id = player.player_id
+        if 0 <= player_id < self.__count and self.__players[player_id] is player:
+            return player_id
+        player_id = self.__count
+        if player_id == len(self.__players):
+            self.__grow()
+        self.__players[player_id] = player
+        self.__count = player_id + 1
+        player.player_id = player_id
+        return player_id
+
+    def __grow(self) -> None:
+        """
+        Doubles the capacity of the id array.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of registered players
+            Worst Case Complexity: O(N), same as best case
+        """
+        players = ArrayR(2 * len(self.__players))
+        players.array[:self.__count] = self.__players.array[:self.__count]
+        self.__players = players
+
+    def __getitem__(self, player_id: int) -> Player:
+        """
+        Returns the player with id `player_id`.
+
+        Raises:
+            IndexError: if no player has that id.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if player_id < 0 or player_id >= self.__count:
+            raise IndexError(f"Player id {player_id} is not registered.")
+        return self.__players[player_id]
+
+    def find(self, name: str) -> int:
+        """
+        Returns the id of the first registered player called `name`.
+
+        Raises:
+            KeyError: if no player has that name.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the name
+            Worst Case Complexity: O(N * K), where N is the number of registered names,
+                when players have registered since the last find
+        """
+        self.__index_names()
+        return self.__ids[name]
+
+    def __index_names(self) -> None:
+        """
+        Adds the names of the players registered since the last call to the name index, creating it if needed.
+
+        Complexity:
+            Best Case Complexity: O(1), when no player has registered since
+            Worst Case Complexity: O(N * K), where N is the number of registered names and K the length of the names
+        """
+        if self.__indexed == self.__count:
+            return
+        if self.__ids is None:
+            self.__ids = LinearProbeTable(self.__index_sizes(self.__count))
+        for player_id in range(self.__indexed, self.__count):
+            name = self.__players[player_id].name
+            if name not in self.__ids:
+                self.__ids[name] = player_id
+        self.__indexed = self.__count
+
+    @classmethod
+    def __index_sizes(cls, count: int) -> ArrayList[int]:
+        """
+        Returns table sizes for a name index that starts out holding `count` names without resizing.
+        Sizes are odd and roughly double each time, so the index keeps growing well past
+        `LinearProbeTable`'s default sizes.
+        """
+        sizes = ArrayList()
+        size = LinearProbeTable.TABLE_SIZES[0]
+        while size <= cls.INDEX_HEADROOM * count:
+            size = 2 * size + 1
+        while size <= cls.MAX_INDEX_SIZE:
+            sizes.append(size)
+            size = 2 * size + 1
+        return sizes
+
+    def names(self, player_ids: Collection[int]) -> ArrayList[str]:
+        """
+        Returns the names of the players with the given ids, in the same order.
+
+        Complexity:
+            Best Case Complexity: O(M), where M is the number of ids
+            Worst Case Complexity: O(M), same as best case
+        """
+        res = ArrayList(max(len(player_ids), 1))
+        for i in range(len(player_ids)):
+            res.append(self.__players[player_ids[i]].name)
+        return res
+
+    def players(self, player_ids: Collection[int]) -> ArrayR[Player]:
+        """
+        Returns the players with the given ids, in the same order.
+
+        Complexity:
+            Best Case Complexity: O(M), where M is the number of ids
+            Worst Case Complexity: O(M), same as best case
+        """
+        res = ArrayR(len(player_ids))
+        for i in range(len(player_ids)):
+            res[i] = self.__players[player_ids[i]]
+        return res
+
+
+# The registry players are added to when they are created, unless a scoped registry is active
+PLAYER_REGISTRY = PlayerRegistry()
+_current_registry = PLAYER_REGISTRY
+
+
+def current_registry() -> PlayerRegistry:
+    """
+    Returns the registry new players are added to.
+    """
+    return _current_registry
+
+
+@contextmanager
+def scoped_registry(registry: PlayerRegistry | None = None) -> Iterator[PlayerRegistry]:
+    """
+    Makes `registry` (or a new empty one) the current registry until the block ends, then restores the previous one.
+    Players created in the block get ids in that registry and are not kept alive by `PLAYER_REGISTRY`, so they
+    can be freed once nothing else refers to them. Their ids only mean something in their own registry, but
+    simulations work on the players themselves, so they can be simulated inside or outside the block.
+
+    Usage:
+    ```
+    with scoped_registry():
+        teams = build_teams()
+        Season(teams).simulate_season()
+    ```
+    """
+    global _current_registry
+    previous = _current_registry
+    _current_registry = PlayerRegistry() if registry is None else registry
+    try:
+        yield _current_registry
+    finally:
+        _current_registry = previous
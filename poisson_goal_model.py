@@ -0,0 +1,161 @@
+from __future__ import annotations
+from algorithms.binary_search import binary_search
+from array import array
+from data_structures.hash_table_identity import IdentityProbeTable
+from data_structures.referential_array import ArrayR
+from math import exp
+from random_gen import RandomGen, RandomStream
+from team import Team
+
+
+class PoissonGoalModel:
+    """
+    Goal model where each team has an attack and a defence rating, and the goals a team scores
+    are Poisson distributed with rate `BASE_RATE * attack / opponent's defence` (times `HOME_ADVANTAGE` at home).
+
+    Rates are rounded to a grid of `RATE_STEP` up to `MAX_RATE`, and the cumulative distribution of every
+    rate on the grid is computed once, for 0 to `MAX_GOALS` goals. Drawing the goals of a team is then a
+    single `random_float()` draw and a binary search of the table, with no `exp` calls.
+    Ratings start at 1 and are nudged towards the observed goals after every game with `update`.
+    """
+
+    BASE_RATE = 1.3
+    HOME_ADVANTAGE = 1.1
+    RATE_STEP = 0.05
+    MAX_RATE = 8.0
+    # The last entry of every table is 1, so at most MAX_GOALS goals are drawn
+    MAX_GOALS = 15
+    LEARNING_RATE = 0.05
+    MIN_RATING = 0.2
+
+    # CDF_TABLES[i][k] is the probability of at most k goals at rate i * RATE_STEP, built on first use
+    CDF_TABLES: ArrayR[array] | None = None
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(R * G), where R is the number of rates on the grid and G is MAX_GOALS,
+                the first time a model is created.
+        """
+        if PoissonGoalModel.CDF_TABLES is None:
+            PoissonGoalModel.CDF_TABLES = PoissonGoalModel.__build_tables()
+        self.__team_indices = IdentityProbeTable()
+        self.__attack = array("d")
+        self.__defence = array("d")
+
+    @classmethod
+    def __build_tables(cls) -> ArrayR[array]:
+        """
+        Computes the cumulative Poisson distribution of every rate on the grid.
+
+        Complexity:
+            Best Case Complexity: O(R * G), where R is the number of rates on the grid and G is MAX_GOALS
+            Worst Case Complexity: O(R * G), same as best case
+        """
+        rate_count = round(cls.MAX_RATE / cls.RATE_STEP) + 1
+        tables = ArrayR(rate_count)
+        for i in range(rate_count):
+            rate = i * cls.RATE_STEP
+            cdf = array("d", bytes(8 * (cls.MAX_GOALS + 1)))
+            probability = exp(-rate)
+            cumulative = 0.0
+            for goals in range(cls.MAX_GOALS):
+                cumulative += probability
+                cdf[goals] = cumulative
+                probability *= rate / (goals + 1)
+            cdf[cls.MAX_GOALS] = 1.0
+            tables[i] = cdf
+        return tables
+
+    def __index(self, team: Team) -> int:
+        """
+        Returns the index of `team`'s ratings, giving it ratings of 1 the first time it is seen.
+        """
+        try:
+            return self.__team_indices[team]
+        except KeyError:
+            index = len(self.__attack)
+            self.__team_indices[team] = index
+            self.__attack.append(1.0)
+            self.__defence.append(1.0)
+            return index
+
+    def ratings(self, team: Team) -> tuple[float, float]:
+        """
+        Returns the (attack, defence) ratings of `team`.
+        """
+        index = self.__index(team)
+        return self.__attack[index], self.__defence[index]
+
+    def set_ratings(self, team: Team, attack: float, defence: float) -> None:
+        """
+        Sets the attack and defence ratings of `team`.
+
+        Raises:
+            ValueError: if a rating is not positive
+        """
+        if attack <= 0 or defence <= 0:
+            raise ValueError("Ratings should be positive.")
+        index = self.__index(team)
+        self.__attack[index] = attack
+        self.__defence[index] = defence
+
+    def expected_goals(self, home_team: Team, away_team: Team) -> tuple[float, float]:
+        """
+        Returns the goal rates of the home and away teams when they play each other, capped at MAX_RATE.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        home, away = self.__index(home_team), self.__index(away_team)
+        home_rate = self.BASE_RATE * self.HOME_ADVANTAGE * self.__attack[home] / self.__defence[away]
+        away_rate = self.BASE_RATE * self.__attack[away] / self.__defence[home]
+        return min(home_rate, self.MAX_RATE), min(away_rate, self.MAX_RATE)
+
+    def draw_goals(self, rate: float, rng: RandomStream | None = None) -> int:
+        """
+        Draws a number of goals from the Poisson distribution with the given rate, rounded to the grid.
+        `rng` defaults to `RandomGen.default`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(log(G)), where G is MAX_GOALS
+        """
+        if rng is None:
+            rng = RandomGen.default
+        cdf = self.CDF_TABLES[round(min(rate, self.MAX_RATE) / self.RATE_STEP)]
+        return binary_search(cdf, rng.random_float())
+
+    def draw(self, home_team: Team, away_team: Team, rng: RandomStream | None = None) -> tuple[int, int]:
+        """
+        Draws the goals scored by the home and away teams in a game between them.
+        `rng` defaults to `RandomGen.default`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(log(G)), where G is MAX_GOALS
+        """
+        if rng is None:
+            rng = RandomGen.default
+        home_rate, away_rate = self.expected_goals(home_team, away_team)
+        return self.draw_goals(home_rate, rng), self.draw_goals(away_rate, rng)
+
+    def update(self, home_team: Team, away_team: Team, home_goals: int, away_goals: int) -> None:
+        """
+        Moves the ratings of both teams towards the result of a game between them: a team that scores more
+        than expected gains attack, and a team that concedes more than expected loses defence.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        home_rate, away_rate = self.expected_goals(home_team, away_team)
+        home, away = self.__index(home_team), self.__index(away_team)
+        home_surprise = self.LEARNING_RATE * (home_goals - home_rate) / self.BASE_RATE
+        away_surprise = self.LEARNING_RATE * (away_goals - away_rate) / self.BASE_RATE
+        self.__attack[home] = max(self.__attack[home] + home_surprise, self.MIN_RATING)
+        self.__defence[away] = max(self.__defence[away] - home_surprise, self.MIN_RATING)
+        self.__attack[away] = max(self.__attack[away] + away_surprise, self.MIN_RATING)
+        self.__defence[home] = max(self.__defence[home] - away_surprise, self.MIN_RATING)
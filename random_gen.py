@@ -1,16 +1,301 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_integer import IntegerProbeTable
+from data_structures.referential_array import ArrayR
+from typing import Iterable
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-class RandomGen:
+
+class RandomStream:
+    """
+    A seeded stream of random numbers. Uses LCG method.
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
+
+    Every stream is independent of the others. Code that draws a lot of numbers should take a stream and call it
+    directly; `RandomGen` forwards its class methods to a shared default stream.
+
+    Usage:
+    ```
+    rng = RandomStream(123)      # A stream of its own, unaffected by other streams
+    rng.random()                 # Random number from 0 to 2^32-1
+    ```
+    """
+
+    # A stream is just its state, so it needs no per-instance __dict__
+    __slots__ = ("seed",)
+
+    MOD: int = pow(2, 48)
+    A: int = 25214903917
+    C: int = 11
+
+    # Distance between the starts of the substreams made by `split`
+    SPLIT_STRIDE: int = 1 << 32
+
+    def __init__(self, seed: int = None) -> None:
+        """Creates a stream seeded with `seed`, or the current time if it is None."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def set_seed(self, seed: int = None) -> None:
+        """Seed all future calls to `random`."""
+        seed = time.time_ns() if seed is None else seed
+        self.seed = seed
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
+
+    @classmethod
+    def _affine_power(cls, n: int) -> tuple[int, int]:
+        """
+        Returns (a, c) such that n steps of the generator take state s to (a * s + c) % MOD.
+        Composes the one-step map with itself by repeated squaring.
+        :complexity: O(log N) where N is n.
+        """
+        if n < 0:
+            raise ValueError("Cannot jump backwards.")
+        a, c = 1, 0
+        step_a, step_c = cls.A, cls.C
+        while n > 0:
+            if n & 1:
+                a, c = (step_a * a) % cls.MOD, (step_a * c + step_c) % cls.MOD
+            step_a, step_c = (step_a * step_a) % cls.MOD, (step_a * step_c + step_c) % cls.MOD
+            n >>= 1
+        return a, c
+
+    def jump(self, n: int) -> None:
+        """
+        Skips the next `n` outputs, leaving the stream where `n` calls to `random` would.
+        :complexity: O(log N) where N is n.
+        """
+        a, c = self._affine_power(n)
+        self.seed = (a * self.seed + c) % self.MOD
+
+    def split(self, k: int) -> ArrayR[RandomStream]:
+        """
+        Returns `k` new streams for parallel work. Stream i starts (i + 1) * SPLIT_STRIDE outputs
+        ahead of this one, so the streams, and this one, do not overlap for SPLIT_STRIDE outputs each.
+        Stream i is the same whatever `k` is, so work split by index gives the same result for any number of workers.
+        This stream is not advanced.
+        The period only has room for MOD // SPLIT_STRIDE streams of SPLIT_STRIDE outputs, this one included,
+        so k must be less than MOD // SPLIT_STRIDE.
+        :complexity: O(K + log(SPLIT_STRIDE)) where K is k.
+        :raises ValueError: if k is negative, or so large that the streams would overlap.
+        """
+        if k < 0:
+            raise ValueError("Cannot split into a negative number of streams.")
+        if k >= self.MOD // self.SPLIT_STRIDE:
+            raise ValueError(f"Cannot split into {k} streams without overlap, the most is {self.MOD // self.SPLIT_STRIDE - 1}.")
+        a, c = self._affine_power(self.SPLIT_STRIDE)
+        streams = ArrayR(k)
+        state = self.seed
+        for i in range(k):
+            state = (a * state + c) % self.MOD
+            streams[i] = RandomStream(state)
+        return streams
+
+    def random_block(self, n: int, backend: str | None = None):
+        """
+        Returns the next `n` outputs of `random` in an array('Q'), advancing the stream as `n` calls would.
+        With backend "numpy" (when NumPy is installed) the outputs come back as a NumPy uint64 array, every state
+        computed at once from the current seed by jumping ahead; the values are the same either way.
+        The default backend is "numpy" when NumPy is installed and "python" otherwise, so the type of the
+        result depends on the environment; pass a backend to always get the same type.
+        :complexity: O(N) where N is n.
+        """
+        if backend is None:
+            backend = "python" if numpy is None else "numpy"
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Unknown random backend {backend}")
+        if n < 0:
+            raise ValueError("Cannot draw a negative number of values.")
+        if backend == "numpy" and numpy is not None:
+            return self.__numpy_block(n)
+        res = array("Q", bytes(8 * n))
+        seed, a, c, mod = self.seed, self.A, self.C, self.MOD
+        for i in range(n):
+            seed = (a * seed + c) % mod
+            res[i] = seed >> 16
+        self.seed = seed
+        return res
+
+    def __numpy_block(self, n: int):
+        """
+        Computes the next `n` outputs with NumPy. The maps for 1 to n steps are built by doubling:
+        m + j + 1 steps are j + 1 steps after m steps. uint64 arithmetic wraps mod 2^64, which 2^48 divides,
+        so masking afterwards gives the exact states.
+        """
+        a = numpy.empty(n, dtype=numpy.uint64)
+        c = numpy.empty(n, dtype=numpy.uint64)
+        if n == 0:
+            return a
+        mask = numpy.uint64(self.MOD - 1)
+        a[0], c[0] = self.A, self.C
+        m = 1
+        while m < n:
+            k = min(m, n - m)
+            a[m:m + k] = (a[:k] * a[m - 1]) & mask
+            c[m:m + k] = (a[:k] * c[m - 1] + c[:k]) & mask
+            m += k
+        states = (a * numpy.uint64(self.seed % self.MOD) + c) & mask
+        self.seed = int(states[-1])
+        return states >> numpy.uint64(16)
+
+    def randint_block(self, n: int, lo: int, hi: int, backend: str | None = None):
+        """
+        Returns the next `n` results of `randint(lo, hi)` in an array('q'), or a NumPy int64 array with backend "numpy".
+        The backend defaults as in `random_block`.
+        :complexity: O(N) where N is n.
+        """
+        block = self.random_block(n, backend)
+        span = hi - lo + 1
+        if numpy is not None and isinstance(block, numpy.ndarray):
+            return (block % numpy.uint64(span)).astype(numpy.int64) + lo
+        res = array("q", bytes(8 * n))
+        for i in range(n):
+            res[i] = block[i] % span + lo
+        return res
+
+    def random_float_block(self, n: int, backend: str | None = None):
+        """
+        Returns the next `n` results of `random_float` in an array('d'), or a NumPy float64 array with backend "numpy".
+        The backend defaults as in `random_block`.
+        :complexity: O(N) where N is n.
+        """
+        block = self.random_block(n, backend)
+        if numpy is not None and isinstance(block, numpy.ndarray):
+            return block / float(1 << 32)
+        res = array("d", bytes(8 * n))
+        for i in range(n):
+            res[i] = block[i] / (1 << 32)
+        return res
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection) -> None:
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__, in place (Fisher-Yates).
+        :complexity: O(N) where N is the length of the collection.
+        """
+        for i in range(len(collection) - 1, 0, -1):
+            j = self.randint(0, i)
+            collection[i], collection[j] = collection[j], collection[i]
+
+    def sample(self, collection, k: int) -> ArrayR:
+        """
+        Returns `k` distinct items of a collection that supports __getitem__ and __len__, chosen without replacement
+        with Floyd's algorithm, using exactly k draws. Every subset is equally likely, but the order within it is not
+        random; shuffle the result if that matters.
+        The chosen indices are kept in an `IntegerProbeTable` sized from k, so it never has to grow
+        and its size does not depend on the length of the collection.
+        :complexity: O(K) where K is k, assuming the probes are O(1) on average.
+        """
+        n = len(collection)
+        if not 0 <= k <= n:
+            raise ValueError(f"Cannot sample {k} items from {n}.")
+        # More than twice as many positions as keys, so the table never rehashes
+        sizes = ArrayR(1)
+        sizes[0] = 2 * k + 1
+        chosen = IntegerProbeTable(sizes)
+        res = ArrayR(k)
+        for x, j in enumerate(range(n - k, n)):
+            t = self.randint(0, j)
+            # t was taken by an earlier step, and j has never been available before, so j takes its place
+            index = j if t in chosen else t
+            chosen[index] = True
+            res[x] = collection[index]
+        return res
+
+    def reservoir_sample(self, items: Iterable, k: int) -> ArrayList:
+        """
+        Returns `k` items chosen uniformly without replacement from an iterable of unknown length, in one pass
+        (reservoir sampling). If there are fewer than `k` items, all of them are returned.
+        :complexity: O(N) where N is the number of items.
+        """
+        if k < 0:
+            raise ValueError(f"Cannot sample {k} items.")
+        res = ArrayList(max(k, 1))
+        for seen, item in enumerate(items):
+            if seen < k:
+                res.append(item)
+            else:
+                j = self.randint(0, seen)
+                if j < k:
+                    res[j] = item
+        return res
+
+    def weighted_choice(self, collection, weights):
+        """
+        Returns an item of a collection that supports __getitem__ and __len__, with probability proportional
+        to its weight, using one draw. For many draws from the same weights, an `AliasTable` is O(1) per draw.
+        :complexity: O(N) where N is the length of the collection.
+        """
+        if len(collection) != len(weights):
+            raise ValueError("There should be one weight per item.")
+        total = 0
+        for i in range(len(weights)):
+            if weights[i] < 0:
+                raise ValueError("Weights cannot be negative.")
+            total += weights[i]
+        if total <= 0:
+            raise ValueError("At least one weight should be positive.")
+        target = self.random_float() * total
+        last = 0
+        for i in range(len(weights)):
+            if weights[i] > 0:
+                last = i
+                target -= weights[i]
+                if target < 0:
+                    return collection[i]
+        # Only reachable through float rounding, so the last item with any weight is taken
+        return collection[last]
+
+
+class _DefaultStreamType(type):
+    """
+    Gives `RandomGen.seed` as the seed of the default stream, as it was when the class kept the state itself.
+    """
+
+    @property
+    def seed(cls) -> int:
+        return cls.default.seed
+
+    @seed.setter
+    def seed(cls, seed: int) -> None:
+        cls.default.seed = seed
+
+
+class RandomGen(metaclass=_DefaultStreamType):
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
 
-    Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    Every class method draws from one shared stream, `RandomGen.default`, a `RandomStream`. To draw without
+    going through the class, or to keep a stream of its own, code can use a `RandomStream` directly.
 
     Usage:
     ```
@@ -21,52 +306,88 @@ class RandomGen:
     ```
     """
 
-    MOD: int = pow(2, 48)
-    A: int = 25214903917
-    C: int = 11
+    MOD: int = RandomStream.MOD
+    A: int = RandomStream.A
+    C: int = RandomStream.C
+    SPLIT_STRIDE: int = RandomStream.SPLIT_STRIDE
 
-    seed = time.time_ns()
+    # The stream the class methods draw from
+    default: RandomStream = RandomStream()
 
     @classmethod
     def set_seed(cls, seed: int = None) -> None:
         """Seed all future calls to `random`."""
-        seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        cls.default.set_seed(seed)
 
     @classmethod
     def random(cls) -> int:
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        return cls.default.random()
+
+    @classmethod
+    def jump(cls, n: int) -> None:
+        """See `RandomStream.jump`."""
+        cls.default.jump(n)
+
+    @classmethod
+    def split(cls, k: int) -> ArrayR[RandomStream]:
+        """See `RandomStream.split`."""
+        return cls.default.split(k)
+
+    @classmethod
+    def random_block(cls, n: int, backend: str | None = None):
+        """See `RandomStream.random_block`."""
+        return cls.default.random_block(n, backend)
+
+    @classmethod
+    def randint_block(cls, n: int, lo: int, hi: int, backend: str | None = None):
+        """See `RandomStream.randint_block`."""
+        return cls.default.randint_block(n, lo, hi, backend)
+
+    @classmethod
+    def random_float_block(cls, n: int, backend: str | None = None):
+        """See `RandomStream.random_float_block`."""
+        return cls.default.random_float_block(n, backend)
 
     @classmethod
     def random_float(cls) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return cls.default.random_float()
 
     @classmethod
     def randint(cls, lo: int, hi: int) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return cls.default.randint(lo, hi)
 
     @classmethod
     def random_chance(cls, ratio: float) -> bool:
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return cls.default.random_chance(ratio)
 
     @classmethod
-    def random_choice(cls, collection) -> None:
+    def random_choice(cls, collection):
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return cls.default.random_choice(collection)
 
     @classmethod
     def random_shuffle(cls, collection) -> None:
         """
-        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
-        :complexity: O(N * Log N) where N is the length of the collection.
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__, in place.
+        :complexity: O(N) where N is the length of the collection.
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
-        positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
-        tmp = [collection[p[1]] for p in positions]
-        for x in range(len(collection)):
-            collection[x] = tmp[x]
+        cls.default.random_shuffle(collection)
+
+    @classmethod
+    def sample(cls, collection, k: int) -> ArrayR:
+        """See `RandomStream.sample`."""
+        return cls.default.sample(collection, k)
+
+    @classmethod
+    def reservoir_sample(cls, items: Iterable, k: int) -> ArrayList:
+        """See `RandomStream.reservoir_sample`."""
+        return cls.default.reservoir_sample(items, k)
+
+    @classmethod
+    def weighted_choice(cls, collection, weights):
+        """See `RandomStream.weighted_choice`."""
+        return cls.default.weighted_choice(collection, weights)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+from data_structures.enum_map import EnumMap
+from data_structures.referential_array import ArrayR
+from enums import TeamGameResult
+
+
+class ResultHistory:
+    """
+    Ring buffer of the most recent `TeamGameResult`s of a team.
+
+    Each result is packed into 2 bits of a `bytearray` (its ordinal), so four results share a byte.
+    The number of wins, draws and losses, the form points and the current streak over the results
+    in the window are kept up to date as results are added, so reading them is O(1).
+    """
+
+    BITS_PER_RESULT = 2
+    RESULTS_PER_BYTE = 8 // BITS_PER_RESULT
+    MASK = (1 << BITS_PER_RESULT) - 1
+
+    # Decodes a stored ordinal back to its result
+    _RESULTS = ArrayR(len(TeamGameResult.__members__))
+    for _result in TeamGameResult:
+        _RESULTS[_result.ordinal] = _result
+    del _result
+
+    def __init__(self, capacity: int, points: EnumMap[TeamGameResult, int]) -> None:
+        """
+        Args:
+            capacity (int): The number of results to keep
+            points (EnumMap[TeamGameResult, int]): The points each result is worth, e.g. `Team._POINTS_MAP`,
+                so form points always agree with the team's points. The map is not copied.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the capacity
+            Worst Case Complexity: O(C), same as best case
+        """
+        if capacity < 0:
+            raise ValueError("Capacity cannot be negative.")
+        self.capacity = capacity
+        self.__points = points
+        self.__data = bytearray((capacity + self.RESULTS_PER_BYTE - 1) // self.RESULTS_PER_BYTE)
+        self.__start = 0
+        self.__count = 0
+        self.__result_counts = EnumMap(TeamGameResult)
+        for result in TeamGameResult:
+            self.__result_counts[result] = 0
+        self.__form_points = 0
+        self.__streak_result = None
+        self.__streak_length = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of results in the window.
+        """
+        return self.__count
+
+    def append(self, result: TeamGameResult) -> None:
+        """
+        Adds `result` as the most recent result, dropping the oldest one if the window is full.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.capacity == 0:
+            return
+        if self.__count == self.capacity:
+            oldest = self._RESULTS[self.__code_at(self.__start)]
+            self.__result_counts[oldest] -= 1
+            self.__form_points -= self.__points[oldest]
+            self.__set_code(self.__start, result.ordinal)
+            self.__start = (self.__start + 1) % self.capacity
+        else:
+            self.__set_code((self.__start + self.__count) % self.capacity, result.ordinal)
+            self.__count += 1
+        self.__result_counts[result] += 1
+        self.__form_points += self.__points[result]
+        if result is self.__streak_result:
+            # A streak can never be longer than the window it is measured over
+            self.__streak_length = min(self.__streak_length + 1, self.__count)
+        else:
+            self.__streak_result = result
+            self.__streak_length = 1
+
+    def count(self, result: TeamGameResult) -> int:
+        """
+        Returns how many of the results in the window are `result`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.__result_counts[result]
+
+    @property
+    def wins(self) -> int:
+        return self.count(TeamGameResult.WIN)
+
+    @property
+    def draws(self) -> int:
+        return self.count(TeamGameResult.DRAW)
+
+    @property
+    def losses(self) -> int:
+        return self.count(TeamGameResult.LOSS)
+
+    @property
+    def form_points(self) -> int:
+        """
+        Returns the points earned over the results in the window.
+        """
+        return self.__form_points
+
+    @property
+    def streak(self) -> tuple[TeamGameResult | None, int]:
+        """
+        Returns the most recent result and how many times in a row it has happened, or (None, 0)
+        if there are no results.
+        """
+        return self.__streak_result, self.__streak_length
+
+    def __getitem__(self, index: int) -> TeamGameResult:
+        """
+        Returns the result at `index` in the window, where 0 is the oldest and -1 the most recent.
+
+        Raises:
+            IndexError: if the index is out of bounds
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if index < -self.__count or index >= self.__count:
+            raise IndexError("Out of bounds access in history.")
+        if index < 0:
+            index += self.__count
+        return self._RESULTS[self.__code_at((self.__start + index) % self.capacity)]
+
+    def __iter__(self):
+        """
+        Iterates over the results in the window, oldest first, without copying them.
+
+        Complexity:
+            Best Case Complexity: O(1) per result
+            Worst Case Complexity: O(1) per result
+        """
+        position = self.__start
+        for _ in range(self.__count):
+            yield self._RESULTS[self.__code_at(position)]
+            position += 1
+            if position == self.capacity:
+                position = 0
+
+    def __reversed__(self):
+        """
+        Iterates over the results in the window, most recent first, without copying them.
+
+        Complexity:
+            Best Case Complexity: O(1) per result
+            Worst Case Complexity: O(1) per result
+        """
+        if self.__count == 0:
+            return
+        position = (self.__start + self.__count - 1) % self.capacity
+        for _ in range(self.__count):
+            yield self._RESULTS[self.__code_at(position)]
+            position -= 1
+            if position < 0:
+                position = self.capacity - 1
+
+    def copy(self) -> ResultHistory:
+        """
+        Returns an independent copy of this history, e.g. to fork a team mid-season.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the capacity; the packed ring is copied as bytes
+            Worst Case Complexity: O(C), same as best case
+        """
+        res = ResultHistory.__new__(ResultHistory)
+        res.capacity = self.capacity
+        res.__points = self.__points
+        res.__data = bytearray(self.__data)
+        res.__start = self.__start
+        res.__count = self.__count
+        res.__result_counts = EnumMap(TeamGameResult)
+        for result in TeamGameResult:
+            res.__result_counts[result] = self.__result_counts[result]
+        res.__form_points = self.__form_points
+        res.__streak_result = self.__streak_result
+        res.__streak_length = self.__streak_length
+        return res
+
+    def view(self) -> HistoryView:
+        """
+        Returns a read-only view over this history.
+        """
+        return HistoryView(self)
+
+    def to_array(self) -> ArrayR[TeamGameResult]:
+        """
+        Returns a copy of the results in the window, oldest first.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of results in the window
+            Worst Case Complexity: O(N), same as best case
+        """
+        res = ArrayR(self.__count)
+        i = 0
+        for result in self:
+            res[i] = result
+            i += 1
+        return res
+
+    def __code_at(self, position: int) -> int:
+        """
+        Returns the 2-bit code stored at ring `position`.
+        """
+        shift = (position % self.RESULTS_PER_BYTE) * self.BITS_PER_RESULT
+        return (self.__data[position // self.RESULTS_PER_BYTE] >> shift) & self.MASK
+
+    def __set_code(self, position: int, code: int) -> None:
+        """
+        Stores the 2-bit `code` at ring `position`.
+        """
+        byte = position // self.RESULTS_PER_BYTE
+        shift = (position % self.RESULTS_PER_BYTE) * self.BITS_PER_RESULT
+        self.__data[byte] = (self.__data[byte] & ~(self.MASK << shift)) | (code << shift)
+
+
+class HistoryView:
+    """
+    Read-only view over a `ResultHistory`.
+
+    The view does not copy the results: it reads the underlying ring buffer, so it always reflects
+    the results added since it was created.
+    """
+
+    def __init__(self, history: ResultHistory) -> None:
+        self.__history = history
+
+    def __len__(self) -> int:
+        return len(self.__history)
+
+    def __getitem__(self, index: int) -> TeamGameResult:
+        """
+        Returns the result at `index`, where 0 is the oldest and -1 the most recent.
+        :complexity: O(1)
+        """
+        return self.__history[index]
+
+    def __iter__(self):
+        """
+        Iterates over the results, oldest first.
+        """
+        return iter(self.__history)
+
+    def __reversed__(self):
+        """
+        Iterates over the results, most recent first.
+        """
+        return reversed(self.__history)
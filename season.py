@@ -2,10 +2,12 @@ from __future__ import annotations
 from data_structures.array_set import ArraySet
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
-from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
-from enums import TeamGameResult, PlayerPosition
+from enums import TeamGameResult
 from game_simulator import GameSimulator, GameSimulationOutcome
+from poisson_goal_model import PoissonGoalModel
 from dataclasses import dataclass
+from random_gen import RandomGen, RandomStream
+import season_numpy
 from team import Team
 
 
@@ -155,101 +157,81 @@ class Season:
         self.update_leaderboard()
         return self.leaderboard
 
-    def simulate_season(self) -> None:
+    def simulate_season(self, backend: str = "python", seed: int | None = None,
+                        goal_model: PoissonGoalModel | None = None, rng: RandomStream | None = None) -> None:
         """
         Simulates the season.
 
+        Args:
+            backend (str): "python" to simulate the games one week at a time, or "numpy" to draw every game of the
+                season at once with NumPy (see season_numpy.py). If NumPy is not installed, "numpy" falls back to "python".
+            seed (int or None): Seed for the random draws. With the "python" backend this reseeds `rng`;
+                if None, the current random state is used.
+            goal_model (PoissonGoalModel or None): Model to draw the goals from, whose ratings are updated after every game.
+                Ratings change from game to game, so a goal model is always simulated with the "python" backend.
+            rng (RandomStream or None): The random stream for the "python" backend. If None, the shared stream
+                `RandomGen.default` is used.
+
         Complexity:
             G = total number of games = N(N-1), where N is the number of teams.
             P = average number of players per team.
             GS = average number of goals per game (small constant).
-            GameSimulator.simulate() complexity: O(P).
-            Best Case Complexity: O(G * (N^2 + P + GS * P)) = O(N^2 * (N^2 + P))
-            Worst Case Complexity: O(G * (N^2 + P + GS * P)) = O(N^2 * (N^2 + P))
+            GameSimulator.simulate_batch() complexity: O(GS) per game, as the teams cache their scorer tables between roster changes.
+            Scorers are found by indexing the rosters they were drawn from, which is O(1) per goal.
+            Best Case Complexity: O(G * (N^2 + GS)) = O(N^4)
+            Worst Case Complexity: O(G * (N^2 + GS)) = O(N^4)
         """
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Unknown simulation backend {backend}")
+        if backend == "numpy" and season_numpy.NUMPY_AVAILABLE and goal_model is None:
+            season_numpy.simulate_season(self, seed)
+            return
+        if rng is None:
+            rng = RandomGen.default
+        if seed is not None:
+            rng.set_seed(seed)
+
         simulator = GameSimulator()
         for week_idx in range(len(self.schedule)):
             week = self.schedule[week_idx]
             # print(f"\n=== Week {week.week} ===")
+            # No team plays twice in a week, so the whole week can be simulated before any result is applied
+            # A goal model's ratings only change for teams that have played, so they stay valid for the rest of the week
+            outcomes = simulator.simulate_batch(week.games, goal_model, rng)
             for game_idx in range(len(week.games)):
                 game = week.games[game_idx]
-                # Simulate the game
-                outcome = simulator.simulate(game.home_team, game.away_team)
+                home_goals = outcomes.home_goals[game_idx]
+                away_goals = outcomes.away_goals[game_idx]
 
                 # Print match result
                 # result = "Draw"
-                # if outcome.home_goals > outcome.away_goals:
+                # if home_goals > away_goals:
                 #     result = f"{game.home_team.name} Win"
-                # elif outcome.home_goals < outcome.away_goals:
+                # elif home_goals < away_goals:
                 #     result = f"{game.away_team.name} Win"
                 # print(
-                #     f"Match {game_idx + 1}: {game.home_team.name} {outcome.home_goals} - {outcome.away_goals} {game.away_team.name} ({result})")
+                #     f"Match {game_idx + 1}: {game.home_team.name} {home_goals} - {away_goals} {game.away_team.name} ({result})")
+
+                if goal_model is not None:
+                    goal_model.update(game.home_team, game.away_team, home_goals, away_goals)
 
                 # Update team results
-                if outcome.home_goals > outcome.away_goals:
+                if home_goals > away_goals:
                     game.home_team.add_result(TeamGameResult.WIN)
                     game.away_team.add_result(TeamGameResult.LOSS)
-                elif outcome.home_goals < outcome.away_goals:
+                elif home_goals < away_goals:
                     game.home_team.add_result(TeamGameResult.LOSS)
                     game.away_team.add_result(TeamGameResult.WIN)
                 else:
                     game.home_team.add_result(TeamGameResult.DRAW)
                     game.away_team.add_result(TeamGameResult.DRAW)
 
-                # Update player goals
-                home_players = game.home_team.get_players()
-                away_players = game.away_team.get_players()
-
-                # Count outfield players (non-goalkeepers) for allocation
-                home_outfield_count = 0
-                away_outfield_count = 0
-                for i in range(len(home_players)):
-                    if home_players[i].position != PlayerPosition.GOALKEEPER:
-                        home_outfield_count += 1
-                for i in range(len(away_players)):
-                    if away_players[i].position != PlayerPosition.GOALKEEPER:
-                        away_outfield_count += 1
-
-                # Allocate ArrayList for outfield players
-                home_outfield = ArrayList()
-                away_outfield = ArrayList()
-
-                # Populate outfield players
-                for i in range(len(home_players)):
-                    if home_players[i].position != PlayerPosition.GOALKEEPER:
-                        home_outfield.append(home_players[i])
-                for i in range(len(away_players)):
-                    if away_players[i].position != PlayerPosition.GOALKEEPER:
-                        away_outfield.append(away_players[i])
-
-                # Map player names to objects for efficient lookup using HashTableSeparateChaining
-                player_map = HashTableSeparateChaining()
-                for i in range(len(home_outfield)):
-                    player_map[home_outfield[i].name] = home_outfield[i]
-                for i in range(len(away_outfield)):
-                    player_map[away_outfield[i].name] = away_outfield[i]
-
-                # Track goals scored by each player in this match
-                # goal_counts = HashTableSeparateChaining()
-                # for i in range(len(outcome.goal_scorers)):
-                #     scorer_name = outcome.goal_scorers[i]
-                #     if scorer_name in goal_counts:
-                #         goal_counts[scorer_name] += 1
-                #     else:
-                #         goal_counts[scorer_name] = 1
-                #
-                # # Debug: Print goal scorers
-                # if len(outcome.goal_scorers) > 0:
-                #     print("Goal Scorers:")
-                #     for scorer_name in goal_counts.keys():
-                #         count = goal_counts[scorer_name]
-                #         print(f"  {scorer_name}: {count} goal(s)")
-
-                # Update goals for scorers
-                for i in range(len(outcome.goal_scorers)):
-                    scorer_name = outcome.goal_scorers[i]
-                    if scorer_name in player_map:
-                        player_map[scorer_name].goals += 1
+                # Update goals for scorers, which the outcome identifies by their position in the rosters drawn from
+                start = outcomes.scorer_offsets[game_idx]
+                for i in range(start, start + home_goals):
+                    game.home_team.add_goals(outcomes.home_rosters[game_idx][outcomes.scorer_positions[i]])
+                for i in range(start + home_goals, outcomes.scorer_offsets[game_idx + 1]):
+                    game.away_team.add_goals(outcomes.away_rosters[game_idx][outcomes.scorer_positions[i]])
 
                 # Update leaderboard after each game
                 self.update_leaderboard()
@@ -0,0 +1,145 @@
+"""
+Vectorised season simulation with NumPy, for large Monte Carlo runs.
+
+NumPy is optional: `NUMPY_AVAILABLE` is False when it is not installed, and `Season.simulate_season`
+then falls back to the pure-Python simulation.
+"""
+from __future__ import annotations
+from alias_table import AliasTable
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_identity import IdentityProbeTable
+from data_structures.referential_array import ArrayR
+from enums import TeamGameResult
+from game_simulator import GameSimulator
+from typing import Collection
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMPY_AVAILABLE = numpy is not None
+
+
+class _PackedTables:
+    """
+    The alias tables of several teams concatenated into flat NumPy arrays, so they can be sampled together.
+    Table `t` owns columns `offsets[t]` to `offsets[t] + sizes[t]` and each of its columns is worth `totals[t]` units.
+    """
+
+    def __init__(self, tables: Collection[AliasTable]) -> None:
+        self.sizes = numpy.zeros(len(tables), dtype=numpy.int64)
+        self.totals = numpy.zeros(len(tables), dtype=numpy.int64)
+        for t in range(len(tables)):
+            self.sizes[t] = len(tables[t])
+            self.totals[t] = tables[t].total
+        self.offsets = numpy.zeros(len(tables), dtype=numpy.int64)
+        numpy.cumsum(self.sizes[:-1], out=self.offsets[1:])
+        column_count = int(self.sizes.sum())
+        self.thresholds = numpy.zeros(column_count, dtype=numpy.int64)
+        self.aliases = numpy.zeros(column_count, dtype=numpy.int64)
+        for t in range(len(tables)):
+            thresholds, aliases = tables[t].columns()
+            start = self.offsets[t]
+            self.thresholds[start:start + len(thresholds)] = numpy.frombuffer(thresholds, dtype=numpy.uint64)
+            self.aliases[start:start + len(aliases)] = numpy.frombuffer(aliases, dtype=numpy.uint64)
+
+    def sample(self, table_indices, generator):
+        """
+        Draws one outcome index from table `table_indices[i]` for every i, as offsets into that table.
+        """
+        sizes = self.sizes[table_indices]
+        draws = (generator.random(len(table_indices)) * (sizes * self.totals[table_indices])).astype(numpy.int64)
+        columns = draws % sizes
+        columns_at = self.offsets[table_indices] + columns
+        return numpy.where(draws // sizes < self.thresholds[columns_at], columns, self.aliases[columns_at])
+
+
+def simulate_season(season, seed: int | None = None) -> None:
+    """
+    Simulates every game of `season` at once with NumPy, then applies the points, histories and goals.
+
+    Teams and players are handled as integer indices: every goal count and every scorer of the season is drawn
+    with a few vectorised operations from the same alias tables the Python simulation uses, and goals are
+    accumulated with `bincount`. Results are applied with `Team.add_result` in schedule order. The draws come from a NumPy generator seeded with `seed`, so the
+    results are reproducible from the seed but differ from the `RandomGen` sequence of the Python simulation.
+
+    Raises:
+        ImportError: if NumPy is not installed
+        ValueError: if a team without outfield players scores
+
+    Complexity:
+        Best Case Complexity: O(G + S + P), where G is the number of games, S the number of goals and P the number of players
+        Worst Case Complexity: O(G + S + P), same as best case
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for the vectorised season simulation.")
+    generator = numpy.random.default_rng(seed)
+    teams = season.teams
+    team_indices = IdentityProbeTable()
+    for t in range(len(teams)):
+        team_indices[teams[t]] = t
+
+    # Fixtures in schedule order, as (home, away) team indices
+    game_count = 0
+    for week_idx in range(len(season.schedule)):
+        game_count += len(season.schedule[week_idx].games)
+    home = numpy.zeros(game_count, dtype=numpy.int64)
+    away = numpy.zeros(game_count, dtype=numpy.int64)
+    game = 0
+    for week_idx in range(len(season.schedule)):
+        games = season.schedule[week_idx].games
+        for game_idx in range(len(games)):
+            home[game] = team_indices[games[game_idx].home_team]
+            away[game] = team_indices[games[game_idx].away_team]
+            game += 1
+
+    # 1. Goal counts, from each team's own distribution or the simulator's default
+    goal_tables = ArrayList(max(len(teams), 1))
+    for t in range(len(teams)):
+        goal_tables.append(teams[t].goal_distribution or GameSimulator.GOAL_DISTRIBUTION)
+    packed_goals = _PackedTables(goal_tables)
+    goal_values = numpy.zeros(len(packed_goals.thresholds), dtype=numpy.int64)
+    for t in range(len(teams)):
+        outcomes = goal_tables[t].outcomes
+        for i in range(len(outcomes)):
+            goal_values[packed_goals.offsets[t] + i] = outcomes[i]
+    home_goals = goal_values[packed_goals.offsets[home] + packed_goals.sample(home, generator)]
+    away_goals = goal_values[packed_goals.offsets[away] + packed_goals.sample(away, generator)]
+
+    # 2. Scorers: one draw per goal from the scoring team's scorer table
+    scoring_teams = numpy.concatenate((numpy.repeat(home, home_goals), numpy.repeat(away, away_goals)))
+    scorer_tables = ArrayList(max(len(teams), 1))
+    team_goals = numpy.bincount(scoring_teams, minlength=len(teams))
+    for t in range(len(teams)):
+        if team_goals[t] > 0 and len(teams[t].get_outfield_players()) == 0:
+            raise ValueError(f"Team {teams[t].name} scored without any outfield players")
+        # Teams that never score still need a placeholder table
+        table = teams[t].scorer_table() if team_goals[t] > 0 else GameSimulator.GOAL_DISTRIBUTION
+        scorer_tables.append(table)
+    packed_scorers = _PackedTables(scorer_tables)
+    scorers = packed_scorers.offsets[scoring_teams] + packed_scorers.sample(scoring_teams, generator)
+    player_goals = numpy.bincount(scorers, minlength=len(packed_scorers.thresholds))
+
+    # 3. Apply the results in schedule order through `add_result`, so points come from the team's points table
+    results = ArrayR(len(TeamGameResult))
+    for result in TeamGameResult:
+        results[result.ordinal] = result
+    home_results = numpy.where(home_goals > away_goals, TeamGameResult.WIN.ordinal,
+                               numpy.where(home_goals == away_goals, TeamGameResult.DRAW.ordinal, TeamGameResult.LOSS.ordinal))
+    away_results = numpy.where(away_goals > home_goals, TeamGameResult.WIN.ordinal,
+                               numpy.where(home_goals == away_goals, TeamGameResult.DRAW.ordinal, TeamGameResult.LOSS.ordinal))
+    for game in range(game_count):
+        teams[home[game]].add_result(results[home_results[game]])
+        teams[away[game]].add_result(results[away_results[game]])
+    for t in range(len(teams)):
+        if team_goals[t] == 0:
+            continue
+        outfield = scorer_tables[t].outcomes
+        start = packed_scorers.offsets[t]
+        for i in range(len(outfield)):
+            if player_goals[start + i] > 0:
+                teams[t].add_goals(outfield[i], int(player_goals[start + i]))
+
+    season.update_leaderboard()
+
@@ -0,0 +1,128 @@
+from __future__ import annotations
+from array import array
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_linear_probing import LinearProbeTable
+
+
+class StatSchema:
+    """
+    Registry interning statistic names to small integer slots.
+
+    A name is hashed once, when it is first interned; after that code can address the
+    statistic by its slot and index arrays directly. Slots are dense and handed out in the
+    order names are first seen, so they are stable for the lifetime of the schema.
+
+    The schema also keeps a revision per slot, which goes up whenever any player or store writes that
+    statistic, so caches derived from statistic values can tell when they are stale.
+    """
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__slots = LinearProbeTable()
+        self.__names = ArrayList()
+        self.__revisions = array("Q")
+        # Revision of the last write that may have changed every slot, such as a reset
+        self.__all_revision = 0
+        self.__last_revision = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of interned statistic names.
+        """
+        return len(self.__names)
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Checks whether `name` has been interned.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the name
+            Worst Case Complexity: O(N * K), where N is the number of interned names
+        """
+        return name in self.__slots
+
+    def slot(self, name: str) -> int:
+        """
+        Returns the slot of `name`, interning it if it has not been seen before.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the name
+            Worst Case Complexity: O(N * K), where N is the number of interned names
+        """
+        try:
+            return self.__slots[name]
+        except KeyError:
+            slot = len(self.__names)
+            self.__slots[name] = slot
+            self.__names.append(name)
+            self.__revisions.append(0)
+            return slot
+
+    def find(self, name: str) -> int:
+        """
+        Returns the slot of `name` without interning it.
+
+        Raises:
+            KeyError: if the name has never been interned.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the name
+            Worst Case Complexity: O(N * K), where N is the number of interned names
+        """
+        return self.__slots[name]
+
+    def name(self, slot: int) -> str:
+        """
+        Returns the name interned at `slot`.
+
+        Raises:
+            IndexError: if no name has that slot.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if slot < 0:
+            raise IndexError("Stat slots cannot be negative.")
+        return self.__names[slot]
+
+
+    def revision(self, slot: int) -> int:
+        """
+        Returns the revision of the values of the statistic in `slot`. It changes whenever they may have changed.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return max(self.__revisions[slot], self.__all_revision)
+
+    def mark_changed(self, slot: int) -> None:
+        """
+        Records that a value of the statistic in `slot` was written.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__last_revision += 1
+        self.__revisions[slot] = self.__last_revision
+
+    def mark_all_changed(self) -> None:
+        """
+        Records that values of any statistic may have been written, e.g. by a reset.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__last_revision += 1
+        self.__all_revision = self.__last_revision
+
+
+# The schema shared by every player and stats store
+STAT_SCHEMA = StatSchema()
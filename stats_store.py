@@ -0,0 +1,284 @@
+from __future__ import annotations
+from array import array
+from data_structures.array_list import ArrayList
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.referential_array import ArrayR
+from stat_schema import STAT_SCHEMA
+
+
+class StatsStore:
+    """
+    Columnar storage for the statistics of many players.
+
+    Every statistic owns one typed column (an `array` of signed 64-bit integers) and a
+    matching `bytearray` of flags recording which rows have set that statistic, so reading a
+    statistic a player never set still raises a KeyError like the per-player storage does.
+    Players are addressed by the integer row returned from `add_row`, and columns by the
+    statistic's slot in `STAT_SCHEMA`; `get` and `set` are thin wrappers over `get_slot`
+    and `set_slot`.
+
+    Columns only grow when a row beyond their current length is written, so rows that never set a
+    statistic cost nothing in that column.
+    """
+
+    TYPECODE = "q"
+    ITEM_SIZE = array(TYPECODE).itemsize
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__row_count = 0
+        # Indexed by stat slot, each entry is None or a (values, set flags) pair
+        self.__columns = ArrayList()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in the store.
+        """
+        return self.__row_count
+
+    def add_row(self) -> int:
+        """
+        Reserves a new row and returns its index.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        row = self.__row_count
+        self.__row_count += 1
+        return row
+
+    def stat_names(self) -> ArrayList[str]:
+        """
+        Returns the names of all statistics that have a column, in slot order.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C), where C is the number of columns
+        """
+        res = ArrayList(len(self.__columns))
+        for slot in range(len(self.__columns)):
+            if self.__columns[slot] is not None:
+                res.append(STAT_SCHEMA.name(slot))
+        return res
+
+    def row_stat_slots(self, row: int) -> ArrayList[int]:
+        """
+        Returns the slots of the statistics that have been set for `row`, in slot order.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C), same as best case
+        """
+        self.__check_row(row)
+        res = ArrayList(len(self.__columns))
+        for slot in range(len(self.__columns)):
+            column = self.__columns[slot]
+            if column is not None and row < len(column[1]) and column[1][row]:
+                res.append(slot)
+        return res
+
+    def get(self, row: int, statistic: str) -> int:
+        """
+        Get the value of `statistic` for `row`.
+
+        Raises:
+            KeyError: if the row never set the statistic.
+            IndexError: if the row does not exist.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the statistic string
+            Worst Case Complexity: O(N * K), where N is the number of interned stat names
+        """
+        try:
+            slot = STAT_SCHEMA.find(statistic)
+        except KeyError:
+            raise KeyError(statistic)
+        return self.get_slot(row, slot)
+
+    def get_slot(self, row: int, slot: int) -> int:
+        """
+        Get the value of the statistic in `slot` for `row`.
+
+        Raises:
+            KeyError: if the row never set the statistic.
+            IndexError: if the row does not exist.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__check_row(row)
+        values, flags = self.__column(slot)
+        if row >= len(flags) or not flags[row]:
+            raise KeyError(STAT_SCHEMA.name(slot))
+        return values[row]
+
+    def set(self, row: int, statistic: str, value: int) -> None:
+        """
+        Set the value of `statistic` for `row`, creating the column if needed.
+
+        Complexity:
+            Best Case Complexity: O(K), where K is the length of the statistic string
+            Worst Case Complexity: O(N * K + R), where N is the number of interned stat names and R the number of rows,
+                when the column has to grow
+        """
+        self.set_slot(row, STAT_SCHEMA.slot(statistic), value)
+
+    def set_slot(self, row: int, slot: int, value: int) -> None:
+        """
+        Set the value of the statistic in `slot` for `row`, creating the column if needed.
+
+        Raises:
+            IndexError: if the row does not exist or the slot is not in `STAT_SCHEMA`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(R + S), where R is the number of rows and S the number of slots,
+                when the column has to be created or grow
+        """
+        self.__check_row(row)
+        if slot < 0 or slot >= len(STAT_SCHEMA):
+            raise IndexError(f"Stat slot {slot} is not in the schema.")
+        while len(self.__columns) <= slot:
+            self.__columns.append(None)
+        if self.__columns[slot] is None:
+            self.__columns[slot] = (array(self.TYPECODE), bytearray())
+        values, flags = self.__columns[slot]
+        if row >= len(values):
+            # Grow geometrically, but never past the rows that exist
+            new_length = min(max(row + 1, 2 * len(values)), self.__row_count)
+            missing = new_length - len(values)
+            values.frombytes(bytes(missing * self.ITEM_SIZE))
+            flags.extend(bytes(missing))
+        values[row] = value
+        flags[row] = 1
+        STAT_SCHEMA.mark_changed(slot)
+
+    def reset_row(self, row: int) -> None:
+        """
+        Resets every statistic of `row` to 0, keeping them listed as set.
+
+        Complexity:
+            Best Case Complexity: O(C), where C is the number of columns
+            Worst Case Complexity: O(C), same as best case
+        """
+        self.__check_row(row)
+        for slot in range(len(self.__columns)):
+            column = self.__columns[slot]
+            if column is not None and row < len(column[0]):
+                column[0][row] = 0
+        STAT_SCHEMA.mark_all_changed()
+
+    def reset(self) -> None:
+        """
+        Resets every statistic of every row to 0, keeping them listed as set.
+        Each column is cleared with a single fill.
+
+        Complexity:
+            Best Case Complexity: O(C + R), where C is the number of columns and R is the number of rows
+            Worst Case Complexity: O(C + R), same as best case
+        """
+        for slot in range(len(self.__columns)):
+            column = self.__columns[slot]
+            if column is not None:
+                column[0][:] = array(self.TYPECODE, bytes(len(column[0]) * self.ITEM_SIZE))
+        STAT_SCHEMA.mark_all_changed()
+
+    def sum(self, statistic: str) -> int:
+        """
+        Returns the total of `statistic` across all rows. Rows that never set it count as 0.
+
+        Complexity:
+            Best Case Complexity: O(K + R), where K is the length of the statistic string, R is the number of rows
+            Worst Case Complexity: O(N * K + R), where N is the number of interned stat names
+        """
+        return sum(self.__named_column(statistic)[0])
+
+    def count(self, statistic: str) -> int:
+        """
+        Returns the number of rows that have set `statistic`.
+
+        Complexity:
+            Best Case Complexity: O(K + R), where K is the length of the statistic string, R is the number of rows
+            Worst Case Complexity: O(N * K + R), where N is the number of interned stat names
+        """
+        return self.__named_column(statistic)[1].count(1)
+
+    def mean(self, statistic: str) -> float:
+        """
+        Returns the mean of `statistic` over the rows that have set it.
+
+        Raises:
+            KeyError: if no row has set the statistic.
+
+        Complexity:
+            Best Case Complexity: O(K + R), where K is the length of the statistic string, R is the number of rows
+            Worst Case Complexity: O(N * K + R), where N is the number of interned stat names
+        """
+        values, flags = self.__named_column(statistic)
+        count = flags.count(1)
+        if count == 0:
+            raise KeyError(statistic)
+        return sum(values) / count
+
+    def top_k(self, statistic: str, k: int) -> ArrayR[int]:
+        """
+        Returns the rows with the `k` highest values of `statistic`, highest first.
+        Only rows that have set the statistic are considered, and ties go to the lower row.
+
+        Complexity:
+            Best Case Complexity: O(K + R * log k), where R is the number of rows, when values arrive in increasing order
+            Worst Case Complexity: O(N * K + R * k), where N is the number of interned stat names
+        """
+        if k < 0:
+            raise ValueError("k cannot be negative.")
+        values, flags = self.__named_column(statistic)
+        best = ArraySortedList(k + 1)
+        for row in range(len(values)):
+            if not flags[row]:
+                continue
+            if len(best) == k:
+                if k == 0 or (values[row], -row) <= best[0]:
+                    continue
+                best.delete_at_index(0)
+            best.add((values[row], -row))
+        res = ArrayR(len(best))
+        for i in range(len(best)):
+            res[i] = -best[len(best) - 1 - i][1]
+        return res
+
+    def __named_column(self, statistic: str) -> tuple[array, bytearray]:
+        """
+        Returns the column of `statistic`.
+
+        Raises:
+            KeyError: if no row has ever set the statistic.
+        """
+        try:
+            return self.__column(STAT_SCHEMA.find(statistic))
+        except KeyError:
+            raise KeyError(statistic)
+
+    def __column(self, slot: int) -> tuple[array, bytearray]:
+        """
+        Returns the column of the statistic in `slot`.
+
+        Raises:
+            KeyError: if no row has ever set the statistic, with the statistic's name if it is interned.
+        """
+        if slot < 0 or slot >= len(self.__columns) or self.__columns[slot] is None:
+            raise KeyError(STAT_SCHEMA.name(slot) if 0 <= slot < len(STAT_SCHEMA) else slot)
+        return self.__columns[slot]
+
+    def __check_row(self, row: int) -> None:
+        """
+        Raises:
+            IndexError: if the row has not been added to the store.
+        """
+        if row < 0 or row >= self.__row_count:
+            raise IndexError(f"Row {row} is not in the store.")
@@ -1,27 +1,35 @@
 from __future__ import annotations
+from array import array
+from age_index import AgeIndex
+from alias_table import AliasTable
+from algorithms.binary_search import binary_search
+from data_structures.array_list import ArrayList
+from data_structures.array_sorted_list import ArraySortedList
 from data_structures.referential_array import ArrayR
+from data_structures.enum_map import EnumMap
+from data_structures.enum_set import EnumSet
+from data_structures.hash_table_identity import IdentityProbeTable
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
 from enums import TeamGameResult, PlayerPosition
 from player import Player
+from result_history import HistoryView, ResultHistory
+from stat_schema import STAT_SCHEMA
 from typing import Collection, TypeVar
 
 T = TypeVar("T")
 
 class Team:
-    # Use ArrayR to store position to index mapping
-    _POSITION_MAPPING = ArrayR(len(PlayerPosition.__members__))
-    _POSITION_MAPPING[0] = PlayerPosition.GOALKEEPER
-    _POSITION_MAPPING[1] = PlayerPosition.DEFENDER
-    _POSITION_MAPPING[2] = PlayerPosition.MIDFIELDER
-    _POSITION_MAPPING[3] = PlayerPosition.STRIKER
+    _ALL_POSITIONS = EnumSet.all_of(PlayerPosition)
+    _OUTFIELD_POSITIONS = _ALL_POSITIONS - EnumSet.of(PlayerPosition, PlayerPosition.GOALKEEPER)
 
-    # Static mapping of TeamGameResult to points using HashTableSeparateChaining, and use the name of the enum as the key
-    _POINTS_MAP = HashTableSeparateChaining()
-    _POINTS_MAP[TeamGameResult.WIN.name] = 3
-    _POINTS_MAP[TeamGameResult.DRAW.name] = 1
-    _POINTS_MAP[TeamGameResult.LOSS.name] = 0
+    # Static mapping of TeamGameResult to points, indexed by the result's ordinal
+    _POINTS_MAP = EnumMap(TeamGameResult)
+    _POINTS_MAP[TeamGameResult.WIN] = 3
+    _POINTS_MAP[TeamGameResult.DRAW] = 1
+    _POINTS_MAP[TeamGameResult.LOSS] = 0
 
-    def __init__(self, team_name: str, initial_players: ArrayR[Player], history_length: int) -> None:
+    def __init__(self, team_name: str, initial_players: ArrayR[Player], history_length: int,
+                 position_limit: int | None = None) -> None:
         """
         Constructor for the Team class
 
@@ -29,6 +37,7 @@ class Team:
             team_name (str): The name of the team
             initial_players (ArrayR[Player]): The players the team starts with initially
             history_length (int): The number of `GameResult`s to store in the history
+            position_limit (int or None): The most players the team can have in any one position, or None for no limit
 
         Returns:
             None
@@ -39,35 +48,44 @@ class Team:
         """
         self.name = team_name
         self.points = 0
-        self._history_length = history_length
-        # Initialize players array based on number of enum members
-        max_pos = len(self._POSITION_MAPPING) - 1
-        self.players = ArrayR(max_pos + 1)
-        self.player_counts = ArrayR(max_pos + 1)  # Track number of players per position
+        self.position_limit = position_limit
+        # Distribution of the goals this team scores in a game, or None to use the simulator's default
+        self.goal_distribution: AliasTable[int] | None = None
+        # Statistic that makes players more likely to score, or None for every outfield player to be equally likely
+        self.scorer_stat: str | None = None
+        # One growable list per position, so storage is proportional to the roster size
+        self.players = EnumMap(PlayerPosition)
         self.player_count = 0
-        # Pre-allocate space for each position (assuming max 100 players per position)
-        MAX_PLAYERS_PER_POSITION = 100
-        for i in range(max_pos + 1):
-            self.players[i] = ArrayR(MAX_PLAYERS_PER_POSITION)  # Pre-allocate with max size
-            self.player_counts[i] = 0
+        for position in PlayerPosition:
+            self.players[position] = ArrayList()
+        # Index of each player within its position's list, for O(1) removal
+        self._player_slots = IdentityProbeTable()
+        # Bumped whenever the roster changes; cached roster views are only valid for the version they were built at
+        self.version = 0
+        self._views_version = -1
+        self._all_players_view = None
+        self._position_views = EnumMap(PlayerPosition)
+        self._outfield_view = None
+        self._scorer_table = None
+        # The scorer stat, its schema revision and the weights the cached scorer table was built from
+        self._scorer_table_stat = None
+        self._scorer_slot = -1
+        self._scorer_table_revision = 0
+        self._scorer_weights = None
+        self._age_index = None
+        # Goals scored by each player while playing for a snapshot, or None to credit `Player.goals` directly
+        self._goal_tallies = None
+        # True while the roster structures may be shared with a snapshot, see `snapshot`
+        self._roster_shared = False
         # Populate initial players
         for player in initial_players:
-            pos_idx = 0
-            while pos_idx < len(self._POSITION_MAPPING) and self._POSITION_MAPPING[pos_idx] != player.position:
-                pos_idx += 1
-            if pos_idx >= len(self._POSITION_MAPPING):
-                raise ValueError("Invalid player position")
-            current_count = self.player_counts[pos_idx]
-            if current_count >= MAX_PLAYERS_PER_POSITION:
-                raise ValueError("Too many players in this position")
-            self.players[pos_idx][current_count] = player
-            self.player_counts[pos_idx] += 1
-            self.player_count += 1
+            self.add_player(player)
         # Initialize history and posts
-        self.history = ArrayR(history_length)
-        self.history_start = 0
-        self.history_count = 0
+        self.history = ResultHistory(history_length, self._POINTS_MAP)
         self.posts = HashTableSeparateChaining()
+        # (date sort key, post date) of every post, oldest first
+        self._post_index = ArraySortedList()
+        self._posts_shared = False
 
     def add_player(self, player: Player) -> None:
         """
@@ -79,60 +97,221 @@ class Team:
         Returns:
             None
 
+        Raises:
+            ValueError: if the player's position is invalid or full, or the player is already in the team
+
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(1)
+            Worst Case Complexity: O(N), where N is the number of players in the team, when the position's list
+                or the slot index has to grow. This is amortised O(1) as both grow geometrically.
         """
-        pos_idx = 0
-        while pos_idx < len(self._POSITION_MAPPING) and self._POSITION_MAPPING[pos_idx] != player.position:
-            pos_idx += 1
-        if pos_idx >= len(self._POSITION_MAPPING):
-            raise ValueError("Invalid player position")
-        current_count = self.player_counts[pos_idx]
-        if current_count >= len(self.players[pos_idx]):
-            raise ValueError("Too many players in this position")
-        self.players[pos_idx][current_count] = player
-        self.player_counts[pos_idx] += 1
-        self.player_count += 1
-
-    def remove_player(self, player: Player) -> None:
+        if player in self._player_slots:
+            raise ValueError(f"Player {player.name} is already in team {self.name}")
+        if not self.has_room(player.position, 1):
+            raise ValueError(f"Team {self.name} has no room for another {player.position.name}")
+        self._attach(player)
+        self.version += 1
+
+    def remove_player(self, player: Player, stable: bool = False) -> None:
         """
         Removes a player from the team.
 
+        By default the last player of the same position takes the removed player's place, so the
+        order of that position changes. Pass `stable=True` to shift the later players down instead
+        and keep the order.
+
         Args:
             player (Player): The player to remove
+            stable (bool): Whether to keep the order of the remaining players in the position
 
         Returns:
             None
 
+        Raises:
+            ValueError: if the player is not in the team
+
         Complexity:
-            Best Case Complexity: O(N), where N is the number of players in the position.
-            Worst Case Complexity: O(N), where N is the number of players in the position.
+            Best Case Complexity: O(1), when stable is False.
+            Worst Case Complexity: O(N), where N is the number of players in the position, when stable is True.
         """
-        pos_idx = 0
-        while pos_idx < len(self._POSITION_MAPPING) and self._POSITION_MAPPING[pos_idx] != player.position:
-            pos_idx += 1
-        if pos_idx >= len(self._POSITION_MAPPING):
-            raise ValueError("Invalid player position")
-        current_count = self.player_counts[pos_idx]
-        found = False
-        for i in range(current_count):
-            if self.players[pos_idx][i] == player:
-                found = True
-                # Shift elements to maintain order
-                for j in range(i, current_count - 1):
-                    self.players[pos_idx][j] = self.players[pos_idx][j + 1]
-                self.players[pos_idx][current_count - 1] = None
-                self.player_counts[pos_idx] -= 1
-                self.player_count -= 1
-                break
-        if not found:
+        if player not in self._player_slots:
             raise ValueError(f"Player {player.name} not found in team {self.name}")
+        self._detach(player, stable)
+        self.version += 1
+
+    def has_room(self, position: PlayerPosition, count: int) -> bool:
+        """
+        Checks whether `count` more players of `position` fit within the team's position limit.
+
+        Raises:
+            ValueError: if `position` is not a PlayerPosition
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        position_players = self._position_players(position)
+        return self.position_limit is None or len(position_players) + count <= self.position_limit
+
+    def _attach(self, player: Player) -> None:
+        """
+        Appends `player` to its position's list without checking it or changing the roster version.
+        Callers must bump `version` once they have finished changing the roster.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N), where N is the number of players in the team, when the roster is shared
+                with a snapshot or has to grow.
+        """
+        self._own_roster()
+        position_players = self._position_players(player.position)
+        self._player_slots[player] = len(position_players)
+        position_players.append(player)
+        self.player_count += 1
+
+    def _detach(self, player: Player, stable: bool = False) -> None:
+        """
+        Removes `player`, which must be in the team, without changing the roster version.
+        Callers must bump `version` once they have finished changing the roster.
+
+        Complexity:
+            Best Case Complexity: O(1), when stable is False.
+            Worst Case Complexity: O(N), where N is the number of players in the team, when stable is True
+                or the roster is shared with a snapshot.
+        """
+        self._own_roster()
+        slot = self._player_slots[player]
+        position_players = self._position_players(player.position)
+        del self._player_slots[player]
+        if stable:
+            # delete_at_index shifts the later players to maintain order
+            position_players.delete_at_index(slot)
+            for i in range(slot, len(position_players)):
+                self._player_slots[position_players[i]] = i
+        else:
+            last = position_players.delete_at_index(len(position_players) - 1)
+            if last is not player:
+                position_players[slot] = last
+                self._player_slots[last] = slot
+        self.player_count -= 1
+
+    def snapshot(self) -> Team:
+        """
+        Returns a fork of the team, e.g. to simulate the rest of a season many times from the same state.
+
+        The fork shares the roster and posts with this team and only copies the points and the history.
+        Whichever team next changes its roster (or posts) copies the shared structures first,
+        so neither team sees the other's roster, post, point or history changes.
+
+        The `Player` objects themselves are shared, including their stats. Goals the fork's players score are
+        kept on the fork instead of in `Player.goals`, so simulating a fork leaves the original players untouched;
+        read them with `goals_of`.
+
+        Complexity:
+            Best Case Complexity: O(H + P), where H is history_length and P is the number of positions
+            Worst Case Complexity: O(H + P), same as best case
+        """
+        fork = Team.__new__(Team)
+        fork.name = self.name
+        fork.points = self.points
+        fork.position_limit = self.position_limit
+        fork.goal_distribution = self.goal_distribution
+        fork.scorer_stat = self.scorer_stat
+        fork.players = self.players
+        fork.player_count = self.player_count
+        fork._player_slots = self._player_slots
+        # The cached views are read-only, so they can be shared too
+        fork.version = self.version
+        fork._views_version = self._views_version
+        fork._all_players_view = self._all_players_view
+        fork._position_views = EnumMap(PlayerPosition)
+        for position in self._position_views.keys():
+            fork._position_views[position] = self._position_views[position]
+        fork._outfield_view = self._outfield_view
+        fork._scorer_table = self._scorer_table
+        fork._scorer_table_stat = self._scorer_table_stat
+        fork._scorer_slot = self._scorer_slot
+        fork._scorer_table_revision = self._scorer_table_revision
+        fork._scorer_weights = self._scorer_weights
+        fork._age_index = self._age_index
+        fork._goal_tallies = IdentityProbeTable()
+        if self._goal_tallies is not None:
+            for player in self._goal_tallies.keys():
+                fork._goal_tallies[player] = self._goal_tallies[player]
+        fork.history = self.history.copy()
+        fork.posts = self.posts
+        fork._post_index = self._post_index
+        self._roster_shared = fork._roster_shared = True
+        self._posts_shared = fork._posts_shared = True
+        return fork
+
+    def _own_roster(self) -> None:
+        """
+        Copies the roster structures if they may be shared with a snapshot, so they can be changed.
+
+        Complexity:
+            Best Case Complexity: O(1), when the roster is not shared.
+            Worst Case Complexity: O(N), where N is the number of players in the team.
+        """
+        if not self._roster_shared:
+            return
+        players = EnumMap(PlayerPosition)
+        player_slots = IdentityProbeTable()
+        for position in PlayerPosition:
+            shared_players = self.players[position]
+            position_players = ArrayList(max(len(shared_players), 1))
+            for i in range(len(shared_players)):
+                position_players.append(shared_players[i])
+                player_slots[shared_players[i]] = i
+            players[position] = position_players
+        self.players = players
+        self._player_slots = player_slots
+        self._roster_shared = False
+
+    def _own_posts(self) -> None:
+        """
+        Copies the posts if they may be shared with a snapshot, so they can be changed.
+
+        Complexity:
+            Best Case Complexity: O(1), when the posts are not shared.
+            Worst Case Complexity: O(N * K), where N is the number of posts and K is the length of the date strings.
+        """
+        if not self._posts_shared:
+            return
+        posts = HashTableSeparateChaining()
+        post_index = ArraySortedList(max(len(self._post_index), 1))
+        for i in range(len(self._post_index)):
+            post_date = self._post_index[i][1]
+            posts[post_date] = self.posts[post_date]
+            # Already in order, so each add lands at the end
+            post_index.add(self._post_index[i])
+        self.posts = posts
+        self._post_index = post_index
+        self._posts_shared = False
+
+    def _position_players(self, position: PlayerPosition) -> ArrayList[Player]:
+        """
+        Returns the list holding the players of `position`.
+
+        Raises:
+            ValueError: if `position` is not a PlayerPosition
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        try:
+            return self.players[position]
+        except KeyError:
+            raise ValueError("Invalid player position")
 
     def get_players(self, position: PlayerPosition | None = None) -> Collection[Player]:
         """
         Returns the players of the team that play in the specified position.
 
+        The returned array is cached until the roster next changes and is shared between callers,
+        so it must be treated as read-only.
+
         Args:
             position (PlayerPosition or None): The position of the players to return
 
@@ -140,31 +319,190 @@ class Team:
             Collection[Player]: The players that play in the specified position
 
         Complexity:
-            Best Case Complexity: O(1), when position is specified and list is empty.
-            Worst Case Complexity: O(N + P * M), where N is total players, P is number of positions, M is max players per position.
+            Best Case Complexity: O(1), when the view for the current roster version is cached.
+            Worst Case Complexity: O(N), where N is the number of players in the team, when the view has to be rebuilt.
         """
+        self._check_views()
         if position is not None:
-            pos_idx = 0
-            while pos_idx < len(self._POSITION_MAPPING) and self._POSITION_MAPPING[pos_idx] != position:
-                pos_idx += 1
-            if pos_idx >= len(self._POSITION_MAPPING):
-                raise ValueError("Invalid player position")
-            count = self.player_counts[pos_idx]
-            result = ArrayR(count)
-            for i in range(count):
-                result[i] = self.players[pos_idx][i]
-            return result
-        result = ArrayR(self.player_count)
+            if position not in self._position_views:
+                self._position_views[position] = self._build_view((self._position_players(position),))
+            return self._position_views[position]
+        if self._all_players_view is None:
+            self._all_players_view = self._build_view(self._lists_of(self._ALL_POSITIONS))
+        return self._all_players_view
+
+    def get_outfield_players(self) -> Collection[Player]:
+        """
+        Returns the players of the team that are not goalkeepers, in the same order as `get_players()`.
+
+        The returned array is cached until the roster next changes and is shared between callers,
+        so it must be treated as read-only.
+
+        Complexity:
+            Best Case Complexity: O(1), when the view for the current roster version is cached.
+            Worst Case Complexity: O(N), where N is the number of players in the team, when the view has to be rebuilt.
+        """
+        self._check_views()
+        if self._outfield_view is None:
+            self._outfield_view = self._build_view(self._lists_of(self._OUTFIELD_POSITIONS))
+        return self._outfield_view
+
+    def scorer_table(self) -> AliasTable[Player]:
+        """
+        Returns the distribution goal scorers are drawn from.
+
+        Without a `scorer_stat` every outfield player is equally likely to score. Otherwise each outfield
+        player is weighted by 1 plus their value of that statistic (0 if they never set it or it is negative),
+        so players without the statistic can still score.
+        The table is cached until the roster or, for a weighted table, one of the team's players' values of
+        the statistic changes.
+
+        Complexity:
+            Best Case Complexity: O(1), when the table is cached and nobody has written the statistic since.
+            Worst Case Complexity: O(N + K), where N is the number of players in the team and K the length of the stat name,
+                when the statistic was written and the weights have to be checked, or the table has to be rebuilt.
+        """
+        self._check_views()
+        if self._scorer_table is not None and self._scorer_table_stat == self.scorer_stat:
+            if self.scorer_stat is None:
+                return self._scorer_table
+            revision = STAT_SCHEMA.revision(self._scorer_slot)
+            if revision == self._scorer_table_revision:
+                return self._scorer_table
+            # Some player's value of the statistic changed, but it may not be one of this team's
+            weights = self._scorer_weights_of(self._scorer_table.outcomes)
+            self._scorer_table_revision = revision
+            if weights == self._scorer_weights:
+                return self._scorer_table
+            self._scorer_weights = weights
+            self._scorer_table = AliasTable(self._scorer_table.outcomes, weights)
+            return self._scorer_table
+        # The table samples from its own array rather than the shared outfield view, so callers that
+        # change the view (e.g. shuffling it) cannot reorder the outcomes under the cached weights
+        outfield = self._build_view(self._lists_of(self._OUTFIELD_POSITIONS))
+        if self.scorer_stat is None:
+            self._scorer_table = AliasTable.uniform(outfield)
+        else:
+            self._scorer_slot = STAT_SCHEMA.slot(self.scorer_stat)
+            self._scorer_table_revision = STAT_SCHEMA.revision(self._scorer_slot)
+            self._scorer_weights = self._scorer_weights_of(outfield)
+            self._scorer_table = AliasTable(outfield, self._scorer_weights)
+        self._scorer_table_stat = self.scorer_stat
+        return self._scorer_table
+
+    def _scorer_weights_of(self, outfield: ArrayR[Player]) -> array:
+        """
+        Returns the scorer weight of each player in `outfield`, as described in `scorer_table`.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of players in `outfield`
+            Worst Case Complexity: O(N), same as best case
+        """
+        weights = array('d', bytes(len(outfield) * array('d').itemsize))
+        for i in range(len(outfield)):
+            try:
+                weights[i] = 1 + max(outfield[i].stat(self._scorer_slot), 0)
+            except KeyError:
+                weights[i] = 1
+        return weights
+
+    def _check_views(self) -> None:
+        """
+        Drops every cached view if the roster changed since they were built.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(P), where P is the number of positions
+        """
+        if self._views_version == self.version:
+            return
+        self._views_version = self.version
+        self._all_players_view = None
+        self._outfield_view = None
+        self._scorer_table = None
+        self._age_index = None
+        for position in self._position_views.keys():
+            del self._position_views[position]
+
+    def _lists_of(self, positions: EnumSet[PlayerPosition]) -> ArrayR[ArrayList[Player]]:
+        """
+        Returns the lists holding the players of `positions`, in position order.
+
+        Complexity:
+            Best Case Complexity: O(P), where P is the number of positions
+            Worst Case Complexity: O(P), same as best case
+        """
+        result = ArrayR(len(positions))
+        i = 0
+        for position in positions:
+            result[i] = self.players[position]
+            i += 1
+        return result
+
+    def _build_view(self, lists: Collection[ArrayList[Player]]) -> ArrayR[Player]:
+        """
+        Copies the players of `lists` into a new array, one list after the other.
+
+        Complexity:
+            Best Case Complexity: O(N), where N is the number of players copied
+            Worst Case Complexity: O(N), same as best case
+        """
+        count = 0
+        for position_players in lists:
+            count += len(position_players)
+        result = ArrayR(count)
         idx = 0
-        for pos_idx in range(len(self._POSITION_MAPPING)):
-            count = self.player_counts[pos_idx]
-            for i in range(count):
-                player = self.players[pos_idx][i]
-                if player is not None:
-                    result[idx] = player
-                    idx += 1
+        for position_players in lists:
+            for i in range(len(position_players)):
+                result[idx] = position_players[i]
+                idx += 1
         return result
 
+    def age_index(self) -> AgeIndex:
+        """
+        Returns an index of the team's players by age, e.g. to find players eligible for an under-21 squad.
+        The index is cached until the roster next changes.
+
+        Complexity:
+            Best Case Complexity: O(1), when the index for the current roster version is cached.
+            Worst Case Complexity: O(N * log(N)), where N is the number of players.
+        """
+        self._check_views()
+        if self._age_index is None:
+            self._age_index = AgeIndex(self.get_players())
+        return self._age_index
+
+    def add_goals(self, player: Player, goals: int = 1) -> None:
+        """
+        Credits `player` with `goals` goals scored for this team: in `Player.goals`, or on the team if it is a snapshot.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self._goal_tallies is None:
+            player.goals += goals
+            return
+        try:
+            self._goal_tallies[player] += goals
+        except KeyError:
+            self._goal_tallies[player] = goals
+
+    def goals_of(self, player: Player) -> int:
+        """
+        Returns the goals of `player`, including those scored for this team if it is a snapshot.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self._goal_tallies is None:
+            return player.goals
+        try:
+            return player.goals + self._goal_tallies[player]
+        except KeyError:
+            return player.goals
+
     def add_result(self, result: TeamGameResult) -> None:
         """
         Add the `result` to this `Team`'s history
@@ -176,15 +514,9 @@ class Team:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(1)
         """
-        # Update points using HashTableSeparateChaining with enum name as key
-        self.points += self._POINTS_MAP[result.name]
-        # Add to history
-        if self.history_count < self._history_length:
-            self.history[self.history_count] = result
-            self.history_count += 1
-        else:
-            self.history[self.history_start] = result
-            self.history_start = (self.history_start + 1) % self._history_length
+        self.points += self._POINTS_MAP[result]
+        # Add to history, which also keeps the win/draw/loss counts, form points and streak up to date
+        self.history.append(result)
 
     def get_history(self) -> Collection[TeamGameResult] | None:
         """
@@ -198,32 +530,146 @@ class Team:
             Best Case Complexity: O(1), when history is empty.
             Worst Case Complexity: O(N), where N is history_length.
         """
-        if self.history_count == 0:
+        if len(self.history) == 0:
             return None
-        result = ArrayR(self.history_count)
-        start = self.history_start
-        for i in range(self.history_count):
-            idx = (start + i) % self._history_length
-            result[i] = self.history[idx]
-        return result
+        return self.history.to_array()
+
+    def history_view(self) -> HistoryView:
+        """
+        Returns a read-only view of the `GameResult` history of the team, oldest first.
+        Unlike `get_history`, the view does not copy the results and always reflects the latest results.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.history.view()
 
     def make_post(self, post_date: str, post_content: str) -> None:
         """
         Publish a team blog `post` for a particular `post_date`.
 
         Args:
-            `post_date` (`str`) - The date of the post
+            `post_date` (`str`) - The date of the post, in one of the formats DD/MM/YYYY, DD-MM-YYYY,
+                YYYY/MM/DD or YYYY-MM-DD
             `post_content` (`str`) - The content of the post
 
         Returns:
             None
 
+        Raises:
+            ValueError: if the date is not in one of the supported formats
+
         Complexity:
-            Best Case Complexity: O(K), where K is the length of the date string.
+            Best Case Complexity: O(K + log(N)), where K is the length of the date string and N is the number of posts,
+                when the post is the newest one.
             Worst Case Complexity: O(N * K), where N is the number of posts, K is the length of the date string.
         """
+        sort_key = self._post_sort_key(post_date)
+        self._own_posts()
+        if post_date not in self.posts:
+            self._post_index.add((sort_key, post_date))
         self.posts[post_date] = post_content
 
+    def latest_posts(self, count: int) -> ArrayR[tuple[str, str]]:
+        """
+        Returns up to `count` of the most recent posts as (date, content) pairs, newest first.
+
+        Complexity:
+            Best Case Complexity: O(1), when count is 0.
+            Worst Case Complexity: O(M * K), where M is the number of posts returned and K is the length of the date strings.
+        """
+        return self._posts_before(len(self._post_index), count)
+
+    def posts_between(self, start_date: str, end_date: str) -> ArrayR[tuple[str, str]]:
+        """
+        Returns the posts dated from `start_date` to `end_date` inclusive as (date, content) pairs, oldest first.
+
+        Complexity:
+            Best Case Complexity: O(log(N)), when there are no posts in the range.
+            Worst Case Complexity: O(log(N) + M * K), where N is the number of posts, M is the number of posts returned
+                and K is the length of the date strings.
+        """
+        start = self._post_position(self._post_sort_key(start_date))
+        end = self._post_position(self._post_sort_key(end_date) + 1)
+        result = ArrayR(max(end - start, 0))
+        for i in range(start, end):
+            post_date = self._post_index[i][1]
+            result[i - start] = (post_date, self.posts[post_date])
+        return result
+
+    def posts_page(self, count: int, before: str | None = None) -> ArrayR[tuple[str, str]]:
+        """
+        Returns a page of up to `count` posts as (date, content) pairs, newest first.
+
+        Pass the date of the last post of the previous page as `before` to get the next, older page.
+        If `before` is None the page starts at the newest post.
+
+        Complexity:
+            Best Case Complexity: O(log(N)), when the page is empty.
+            Worst Case Complexity: O(log(N) + M * K), where N is the number of posts, M is the number of posts returned
+                and K is the length of the date strings.
+        """
+        if before is None:
+            return self.latest_posts(count)
+        end = self._post_position(self._post_sort_key(before), before)
+        return self._posts_before(end, count)
+
+    def _posts_before(self, end: int, count: int) -> ArrayR[tuple[str, str]]:
+        """
+        Returns up to `count` posts from the post index, going back from position `end` (exclusive), newest first.
+        """
+        if count < 0:
+            raise ValueError("Count cannot be negative.")
+        start = max(end - count, 0)
+        result = ArrayR(end - start)
+        for i in range(end - 1, start - 1, -1):
+            post_date = self._post_index[i][1]
+            result[end - 1 - i] = (post_date, self.posts[post_date])
+        return result
+
+    def _post_position(self, sort_key: int, post_date: str | None = None) -> int:
+        """
+        Returns the first position in the post index that is not before (sort_key, post_date).
+        Without a date, that is the first post on or after the day of `sort_key`, as the
+        1-tuple is smaller than any entry it is a prefix of.
+
+        Complexity:
+            Best Case Complexity: O(1), when there are no posts.
+            Worst Case Complexity: O(log(N)), where N is the number of posts.
+        """
+        if len(self._post_index) == 0:
+            return 0
+        target = (sort_key,) if post_date is None else (sort_key, post_date)
+        return binary_search(self._post_index, target)
+
+    @staticmethod
+    def _post_sort_key(post_date: str) -> int:
+        """
+        Converts a date in one of the formats DD/MM/YYYY, DD-MM-YYYY, YYYY/MM/DD or YYYY-MM-DD
+        into the integer YYYYMMDD, so that dates sort chronologically.
+
+        Raises:
+            ValueError: if the date is not in one of these formats
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if len(post_date) != 10:
+            raise ValueError(f"Invalid post date {post_date}")
+        delimiter = post_date[4] if post_date[4] in "/-" else post_date[2]
+        parts = post_date.split(delimiter)
+        if len(parts) != 3 or delimiter not in "/-":
+            raise ValueError(f"Invalid post date {post_date}")
+        if len(parts[0]) == 4:
+            year, month, day = parts
+        else:
+            day, month, year = parts
+        if len(year) != 4 or len(month) != 2 or len(day) != 2 or not (year + month + day).isdigit():
+            raise ValueError(f"Invalid post date {post_date}")
+        return int(year) * 10000 + int(month) * 100 + int(day)
+
     def __len__(self) -> int:
         """
         Returns the number of players in the team.
@@ -12,6 +12,9 @@ from enums import PlayerPosition
 
 import player
 from player import Player
+from player_registry import PLAYER_REGISTRY, PlayerRegistry, current_registry, scoped_registry
+from stat_schema import STAT_SCHEMA
+from stats_store import StatsStore
 
 
 class TestTask3Setup(TestCase):
@@ -99,6 +102,131 @@ class TestTask3(TestTask3Setup):
         for val, player_stat in enumerate(self.sample_stats):
             self.assertEqual(sample_player[player_stat], 0, f"Stat {player_stat} not reset to 0 after `reset_stats` method called.")
 
+    def test_player_stat_set_after_reset(self):
+        """
+        #name(Test stats set after a reset keep their new value)
+        """
+        sample_player = self.sample_players[0]
+
+        for val, player_stat in enumerate(self.sample_stats):
+            sample_player[player_stat] = val + 1
+        sample_player.reset_stats()
+        sample_player[self.sample_stats[0]] = 9
+
+        self.assertEqual(sample_player[self.sample_stats[0]], 9)
+        self.assertEqual(sample_player[self.sample_stats[1]], 0)
+        self.assertEqual(len(sample_player.stats), len(self.sample_stats), "Reset stats should still be listed.")
+
+    def test_player_stat_reset_without_stats(self):
+        """
+        #name(Test resetting and reading stats on a player with no stats)
+        """
+        sample_player = self.sample_players[1]
+
+        sample_player.reset_stats()
+        with self.assertRaises(KeyError):
+            sample_player[self.sample_stats[0]]
+
+        sample_player[self.sample_stats[0]] = 5
+        self.assertEqual(sample_player[self.sample_stats[0]], 5)
+
+    def test_player_stat_slots(self):
+        """
+        #name(Test reading and writing stats through interned slots)
+        """
+        sample_player = self.sample_players[0]
+        slot = STAT_SCHEMA.slot("TACKLES")
+        self.assertEqual(STAT_SCHEMA.slot("TACKLES"), slot, "Interning the same name should give the same slot")
+
+        sample_player.set_stat(slot, 4)
+        self.assertEqual(sample_player["TACKLES"], 4)
+        sample_player["TACKLES"] = 6
+        self.assertEqual(sample_player.stat(slot), 6)
+        self.assertRaises(KeyError, lambda: self.sample_players[1].stat(slot))
+
+        # Alternating names must not mix up the cached lookup
+        sample_player["ASSISTS"] = 2
+        self.assertEqual((sample_player["TACKLES"], sample_player["ASSISTS"], sample_player["TACKLES"]), (6, 2, 6))
+        self.assertRaises(KeyError, lambda: self.sample_players[1]["TACKLES"])
+        self.assertRaises(KeyError, lambda: sample_player["NEVER INTERNED"])
+
+    def test_player_stats_view(self):
+        """
+        #name(Test the stats table writes through to the player)
+        """
+        sample_player = self.sample_players[0]
+        sample_player.stats["Goals"] = 5
+        self.assertEqual(sample_player["Goals"], 5)
+        self.assertIn("Goals", sample_player.stats)
+        self.assertNotIn("Saves", sample_player.stats)
+        self.assertEqual(sample_player.stats.keys().to_list(), ["Goals"])
+        self.assertEqual(sample_player.stats.values().to_list(), [5])
+        self.assertRaises(TypeError, lambda: sample_player.stats.__delitem__("Goals"))
+
+    def test_player_stats_in_store(self):
+        """
+        #name(Test players keeping their stats in a shared StatsStore)
+        """
+        store = StatsStore()
+        players = [Player(name, position, age, store) for name, position, age in self.sample_players_data]
+
+        for val, sample_player in enumerate(players):
+            sample_player["TACKLES"] = val + 1
+        players[0]["ASSISTS"] = 7
+
+        self.assertEqual(players[2]["TACKLES"], 3)
+        self.assertRaises(KeyError, lambda: players[1]["ASSISTS"])
+        STAT_SCHEMA.slot("INTERCEPTIONS")
+        with self.assertRaises(KeyError) as missing:
+            players[0]["INTERCEPTIONS"]
+        self.assertEqual(missing.exception.args, ("INTERCEPTIONS",))
+        self.assertRaises(IndexError, lambda: store.set_slot(0, len(STAT_SCHEMA), 1))
+        self.assertEqual(store.sum("TACKLES"), 10)
+        self.assertEqual(store.mean("TACKLES"), 2.5)
+        self.assertEqual(store.top_k("TACKLES", 2).to_list(), [3, 2])
+
+        players[3].reset_stats()
+        self.assertEqual(players[3]["TACKLES"], 0)
+        store.reset()
+        self.assertEqual(players[0]["ASSISTS"], 0)
+        self.assertEqual(store.sum("TACKLES"), 0)
+
+    def test_player_registry_ids(self):
+        """
+        #name(Test players are registered with dense ids)
+        """
+        ids = [sample_player.player_id for sample_player in self.sample_players]
+        self.assertEqual(ids, list(range(ids[0], ids[0] + len(ids))), "Ids should be dense and in creation order")
+        for sample_player in self.sample_players:
+            self.assertIs(PLAYER_REGISTRY[sample_player.player_id], sample_player)
+        self.assertEqual(PLAYER_REGISTRY.register(self.sample_players[0]), ids[0], "Registering again should keep the id")
+
+        unique = Player("A Name Nobody Else Has", PlayerPosition.STRIKER, 20)
+        self.assertEqual(PLAYER_REGISTRY.find(unique.name), unique.player_id)
+        self.assertEqual(PLAYER_REGISTRY.players(ids[:2]).to_list(), self.sample_players[:2])
+        names = PLAYER_REGISTRY.names(ids[:2])
+        self.assertEqual([names[0], names[1]], [p.name for p in self.sample_players[:2]])
+
+        # Players registered after the name index was built are still found
+        later = Player("Another Unique Name", PlayerPosition.DEFENDER, 25)
+        self.assertEqual(PLAYER_REGISTRY.find(later.name), later.player_id)
+        self.assertEqual(PLAYER_REGISTRY.find(unique.name), unique.player_id)
+
+    def test_scoped_player_registry(self):
+        """
+        #name(Test players created in a scoped registry stay out of the global one)
+        """
+        before = len(PLAYER_REGISTRY)
+        with scoped_registry() as registry:
+            self.assertIs(current_registry(), registry)
+            scoped = Player("Scoped Player", PlayerPosition.MIDFIELDER, 22)
+            self.assertEqual(scoped.player_id, 0)
+            self.assertIs(registry[0], scoped)
+        self.assertIs(current_registry(), PLAYER_REGISTRY)
+        self.assertEqual(len(PLAYER_REGISTRY), before)
+        self.assertNotIn(scoped, PLAYER_REGISTRY)
+        self.assertIsInstance(registry, PlayerRegistry)
+
 
 class TestTask3Approach(TestTask3Setup):    
     def test_python_built_ins_not_used(self):
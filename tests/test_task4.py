@@ -9,6 +9,10 @@ from enums import PlayerPosition
 from player import Player
 from team import Team
 from enums import TeamGameResult
+from clock import FixedClock
+from data_structures.enum_map import EnumMap
+from result_history import ResultHistory
+from transfers import Transfer, TransferEngine
 
 
 class TestTask4Setup(TestCase):
@@ -119,6 +123,54 @@ class TestTask4(TestTask4Setup):
         expected_points += TeamGameResult.LOSS.value
         self.assertEqual(self.sample_team.points, expected_points, f"The team should have {expected_points} points after losing.")
 
+    def test_teams_results_aggregates(self):
+        """
+        #name(Test the win/draw/loss counts, form and streak over the history window)
+        """
+        results = [TeamGameResult.LOSS, TeamGameResult.WIN, TeamGameResult.DRAW] + [TeamGameResult.WIN] * 9
+        for result in results:
+            self.sample_team.add_result(result)
+
+        # Only the last 10 results are in the window: DRAW followed by 9 WINs
+        history = self.sample_team.history
+        self.assertEqual(take_out_from_adt(self.sample_team.get_history()).to_list(), results[-10:])
+        self.assertEqual((history.wins, history.draws, history.losses), (9, 1, 0))
+        self.assertEqual(history.form_points, 9 * Team._POINTS_MAP[TeamGameResult.WIN] + Team._POINTS_MAP[TeamGameResult.DRAW])
+        self.assertEqual(history.streak, (TeamGameResult.WIN, 9))
+
+        self.sample_team.add_result(TeamGameResult.WIN)
+        self.assertEqual(history.streak, (TeamGameResult.WIN, 10))
+
+        # Form points come from the points table the history was given, not the enum values
+        two_point_wins = EnumMap(TeamGameResult)
+        for result, points in ((TeamGameResult.WIN, 2), (TeamGameResult.DRAW, 1), (TeamGameResult.LOSS, 0)):
+            two_point_wins[result] = points
+        custom = ResultHistory(3, two_point_wins)
+        for result in (TeamGameResult.WIN, TeamGameResult.DRAW, TeamGameResult.WIN, TeamGameResult.WIN):
+            custom.append(result)
+        self.assertEqual(custom.form_points, 5)
+        self.assertEqual(custom.copy().form_points, 5)
+        self.assertEqual(history.draws, 0)
+
+    def test_teams_history_view(self):
+        """
+        #name(Test the history view follows the ring buffer without copying)
+        """
+        view = self.sample_team.history_view()
+        self.assertEqual(len(view), 0)
+
+        results = [TeamGameResult.WIN, TeamGameResult.LOSS, TeamGameResult.DRAW] * 4
+        for result in results:
+            self.sample_team.add_result(result)
+
+        expected = results[-self.sample_history_length:]
+        self.assertEqual(len(view), len(expected))
+        self.assertEqual(list(view), expected)
+        self.assertEqual(list(reversed(view)), expected[::-1])
+        self.assertEqual(view[0], expected[0])
+        self.assertEqual(view[-1], expected[-1])
+        self.assertRaises(IndexError, lambda: view[len(expected)])
+
     def _check_get_players_on_all_positions(self, expected_players):
         for query_position in PlayerPosition:
             team_players = self.sample_team.get_players(query_position)
@@ -200,6 +252,161 @@ class TestTask4(TestTask4Setup):
         # Check if the players are still correct
         self._check_get_players_without_position(self.init_players[1:])
             
+    def test_teams_players_remove_order(self):
+        """
+        #name(Test swap and stable removal of players)
+        """
+        extra_strikers = [Player(f"Striker {i}", PlayerPosition.STRIKER, 20) for i in range(3)]
+        for striker in extra_strikers:
+            self.sample_team.add_player(striker)
+
+        # Alexey, Striker 0, Striker 1, Striker 2 -> the last striker fills the gap
+        self.sample_team.remove_player(self.init_players[0])
+        strikers = take_out_from_adt(self.sample_team.get_players(PlayerPosition.STRIKER))
+        self.assertEqual([p.name for p in strikers], ["Striker 2", "Striker 0", "Striker 1"])
+
+        self.sample_team.remove_player(extra_strikers[2], stable=True)
+        strikers = take_out_from_adt(self.sample_team.get_players(PlayerPosition.STRIKER))
+        self.assertEqual([p.name for p in strikers], ["Striker 0", "Striker 1"])
+
+        self.sample_team.remove_player(extra_strikers[1])
+        self.assertEqual(len(self.sample_team), len(self.init_players))
+        self.assertRaises(ValueError, lambda: self.sample_team.remove_player(extra_strikers[1]))
+
+    def test_team_cached_views(self):
+        """
+        #name(Test roster views are cached until the roster changes)
+        """
+        players = self.sample_team.get_players()
+        outfield = self.sample_team.get_outfield_players()
+        self.assertIs(self.sample_team.get_players(), players, "The view should be reused while the roster is unchanged")
+        self.assertEqual(len(outfield), len(self.init_players) - 1)
+        self.assertTrue(all(p.position != PlayerPosition.GOALKEEPER for p in outfield.to_list()))
+
+        self.sample_team.add_player(self.extra_players[3])
+        self.assertIsNot(self.sample_team.get_players(), players, "The view should be rebuilt after the roster changes")
+        self.assertEqual(len(self.sample_team.get_outfield_players()), len(self.init_players))
+
+    def test_team_invalid_position(self):
+        """
+        #name(Test positions that are not a PlayerPosition are rejected)
+        """
+        self.assertRaises(ValueError, lambda: self.sample_team.get_players("STRIKER"))
+        self.assertRaises(ValueError, lambda: self.sample_team.get_players(TeamGameResult.WIN))
+        self.assertRaises(ValueError, lambda: self.sample_team.add_player(Player("Nobody", "Coach", 40)))
+        self.assertEqual(len(self.sample_team), len(self.init_players))
+
+    def test_team_transfers(self):
+        """
+        #name(Test applying a batch of transfers between teams)
+        """
+        other_team = Team("Other Team", ArrayR.from_list(self.extra_players), self.sample_history_length, position_limit=1)
+        alexey, bobby = self.init_players[0], self.extra_players[3]
+        self.assertRaises(ValueError, lambda: other_team.add_player(Player("Extra", PlayerPosition.STRIKER, 20)))
+
+        # A swap between two teams is fine even though the other team's strikers are full in between
+        TransferEngine.apply(ArrayR.from_list([
+            Transfer(alexey, self.sample_team, other_team),
+            Transfer(bobby, other_team, self.sample_team),
+        ]))
+        self.assertEqual([p.name for p in take_out_from_adt(other_team.get_players(PlayerPosition.STRIKER))], ["Alexey"])
+        self.assertEqual([p.name for p in take_out_from_adt(self.sample_team.get_players(PlayerPosition.STRIKER))], ["Bobby"])
+
+        # A player can move on again within the same batch
+        third_team = Team("Third Team", ArrayR(0), self.sample_history_length)
+        TransferEngine.apply(ArrayR.from_list([
+            Transfer(alexey, other_team, self.sample_team),
+            Transfer(alexey, self.sample_team, third_team),
+        ]))
+        self.assertEqual(len(other_team.get_players(PlayerPosition.STRIKER)), 0)
+        self.assertEqual(take_out_from_adt(third_team.get_players()).to_list(), [alexey])
+
+        # Invalid batches are rejected before any team changes
+        version = self.sample_team.version
+        self.assertRaises(ValueError, lambda: TransferEngine.apply(ArrayR.from_list([
+            Transfer(self.init_players[1], self.sample_team, other_team),
+            Transfer(alexey, self.sample_team, other_team),
+        ])))
+        self.assertRaises(ValueError, lambda: TransferEngine.apply(ArrayR.from_list([
+            Transfer(self.init_players[1], self.sample_team, other_team),
+        ])))
+        self.assertEqual(self.sample_team.version, version)
+        self.assertEqual(len(self.sample_team), len(self.init_players))
+        self.assertEqual(len(other_team), len(self.extra_players) - 1)
+
+    def test_team_weighted_scorers(self):
+        """
+        #name(Test scorer tables weighted by a stat are cached until the stat changes)
+        """
+        uniform = self.sample_team.scorer_table()
+        self.assertIs(self.sample_team.scorer_table(), uniform)
+        self.assertEqual([uniform.probability(i) for i in range(len(uniform))], [1 / 3] * 3)
+
+        self.sample_team.scorer_stat = "Shots On Target"
+        alexey, maria = self.init_players[0], self.init_players[1]
+        alexey["Shots On Target"] = 4
+        weighted = self.sample_team.scorer_table()
+        self.assertIsNot(weighted, uniform)
+        self.assertIs(self.sample_team.scorer_table(), weighted, "The table should be reused while the stat is unchanged")
+        probabilities = {weighted.outcomes[i].name: weighted.probability(i) for i in range(len(weighted))}
+        self.assertEqual(probabilities, {"Alexey": 5 / 7, "Maria": 1 / 7, "Brendon": 1 / 7})
+
+        maria["Shots On Target"] = 4
+        rebuilt = self.sample_team.scorer_table()
+        self.assertIsNot(rebuilt, weighted, "Changing the stat should rebuild the table")
+        alexey.reset_stats()
+        self.assertIsNot(self.sample_team.scorer_table(), rebuilt, "Resetting stats should rebuild the table")
+
+        # Writes to the stat by players of other teams keep the table
+        table = self.sample_team.scorer_table()
+        self.extra_players[0]["Shots On Target"] = 9
+        self.assertIs(self.sample_team.scorer_table(), table, "Other teams' players should not rebuild the table")
+        self.sample_team.scorer_stat = " ".join(["Shots", "On", "Target"])
+        self.assertIs(self.sample_team.scorer_table(), table, "An equal stat name should keep the table")
+
+    def test_team_scorer_table_not_shared_with_views(self):
+        """
+        #name(Test changing a roster view does not reorder the cached scorer table)
+        """
+        self.sample_team.scorer_stat = "Shots On Target"
+        self.init_players[0]["Shots On Target"] = 4
+        table = self.sample_team.scorer_table()
+        before = [table.outcomes[i] for i in range(len(table))]
+        outfield = self.sample_team.get_outfield_players()
+        outfield[0], outfield[2] = outfield[2], outfield[0]
+        self.assertIs(self.sample_team.scorer_table(), table)
+        self.assertEqual([table.outcomes[i] for i in range(len(table))], before)
+        self.assertEqual(table.probability(before.index(self.init_players[0])), 5 / 7)
+
+    def test_team_large_position(self):
+        """
+        #name(Test a position holding more than 100 players)
+        """
+        strikers = [Player(f"Striker {i}", PlayerPosition.STRIKER, 20) for i in range(150)]
+        for striker in strikers:
+            self.sample_team.add_player(striker)
+
+        self.assertEqual(len(self.sample_team), len(self.init_players) + len(strikers))
+        team_strikers = take_out_from_adt(self.sample_team.get_players(PlayerPosition.STRIKER))
+        self.assertEqual(len(team_strikers), len(strikers) + 1)
+        self.assertEqual(team_strikers[150].name, "Striker 149")
+
+    def test_team_age_index(self):
+        """
+        #name(Test finding players in an age range)
+        """
+        index = self.sample_team.age_index()
+        self.assertEqual([p.name for p in index.between(18, 21).to_list()], ["Alexey", "Brendon"])
+        self.assertEqual(len(index.between(40, 50)), 0)
+
+        # Two years on, only the youngest player is still under 21
+        Player.set_clock(FixedClock(Player.clock.current_year() + 2))
+        try:
+            self.assertEqual([p.name for p in index.between(0, 20).to_list()], ["Alexey"])
+            self.assertEqual(Player.ages(ArrayR.from_list(self.init_players)).to_list(), [20, 33, 23, 25])
+        finally:
+            Player.set_clock()
+
     def test_call_post_update(self):
         """
         #name(Test calling the make_post method)
@@ -209,6 +416,54 @@ class TestTask4(TestTask4Setup):
         except Exception as e:
             self.fail(f"Team make_post() raised an exception: {e}")
 
+    def test_posts_in_date_order(self):
+        """
+        #name(Test latest posts, date ranges and paging)
+        """
+        self.sample_team.make_post("2025/03/01", "March")
+        self.sample_team.make_post("01-01-2025", "January")
+        self.sample_team.make_post("2025-02-01", "February")
+        self.sample_team.make_post("15/02/2025", "Mid February")
+        self.sample_team.make_post("2025-02-01", "February, edited")
+
+        latest = self.sample_team.latest_posts(2).to_list()
+        self.assertEqual(latest, [("2025/03/01", "March"), ("15/02/2025", "Mid February")])
+        self.assertEqual(len(self.sample_team.latest_posts(10)), 4)
+
+        between = self.sample_team.posts_between("2025-01-15", "2025-02-15").to_list()
+        self.assertEqual(between, [("2025-02-01", "February, edited"), ("15/02/2025", "Mid February")])
+
+        page = self.sample_team.posts_page(3, before=latest[-1][0]).to_list()
+        self.assertEqual([post[1] for post in page], ["February, edited", "January"])
+
+        self.assertRaises(ValueError, lambda: self.sample_team.make_post("March 1st", "Bad date"))
+
+    def test_team_snapshot(self):
+        """
+        #name(Test snapshots are independent of the team they were taken from)
+        """
+        self.sample_team.add_result(TeamGameResult.WIN)
+        self.sample_team.make_post("2025/03/01", "March")
+        players = self.sample_team.get_players()
+        fork = self.sample_team.snapshot()
+        self.assertIs(fork.get_players(), players, "An unchanged roster should be shared")
+
+        fork.add_result(TeamGameResult.LOSS)
+        fork.add_player(self.extra_players[3])
+        fork.make_post("2025/04/01", "April")
+        self.sample_team.remove_player(self.init_players[0])
+
+        self.assertEqual(self.sample_team.points, 3)
+        self.assertEqual(take_out_from_adt(self.sample_team.get_history()).to_list(), [TeamGameResult.WIN])
+        self.assertEqual(take_out_from_adt(fork.get_history()).to_list(), [TeamGameResult.WIN, TeamGameResult.LOSS])
+        self.assertEqual(len(self.sample_team), len(self.init_players) - 1)
+        self.assertEqual(len(fork), len(self.init_players) + 1)
+        fork_strikers = take_out_from_adt(fork.get_players(PlayerPosition.STRIKER))
+        self.assertEqual([p.name for p in fork_strikers], ["Alexey", "Bobby"])
+        self.assertEqual(len(self.sample_team.get_players(PlayerPosition.STRIKER)), 0)
+        self.assertEqual(len(self.sample_team.latest_posts(10)), 1)
+        self.assertEqual(len(fork.latest_posts(10)), 2)
+
 
 class TestTask4Approach(TestTask4Setup):
     def test_python_built_ins_not_used(self):
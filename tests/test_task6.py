@@ -1,14 +1,22 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+
+from array import array
 
 import inspect
 import ast
 
+from alias_table import AliasTable
 from enums import PlayerPosition
+from game_simulator import GameSimulator
+from poisson_goal_model import PoissonGoalModel
 from data_structures.referential_array import ArrayR
 from tests.helper import take_out_from_adt, CollectionsFinder
 from player import Player
-from random_gen import RandomGen
+from random_gen import RandomGen, RandomStream
+import random_gen
 from season import Season
+import season_numpy
+from player_registry import PLAYER_REGISTRY, scoped_registry
 from team import Team
 
 
@@ -81,6 +89,295 @@ class TestTask6(TestTask6Setup):
             "Dragons",
             "The winner of the season is not correct"
         )
+        self.assertEqual([team.points for team in self.teams], [8, 14, 12, 13, 17, 18],
+                         "The seeded season should give the same standings as drawing goals from the list directly")
+
+
+    def test_alias_table(self):
+        """
+        #name(Test alias tables sample their distribution)
+        """
+        table = AliasTable(ArrayR.from_list(["a", "b", "c", "d"]), ArrayR.from_list([5, 0, 2.5, 2.5]))
+        self.assertEqual([table.probability(i) for i in range(4)], [0.5, 0, 0.25, 0.25])
+        self.assertNotIn("b", [table.sample() for _ in range(200)])
+        self.assertRaises(ValueError, lambda: AliasTable(ArrayR.from_list(["a"]), ArrayR.from_list([0])))
+
+        # Equal weights give the same draws as random_choice
+        outcomes = ArrayR.from_list(list(range(7)))
+        RandomGen.set_seed(7)
+        expected = [RandomGen.random_choice(outcomes) for _ in range(50)]
+        RandomGen.set_seed(7)
+        self.assertEqual([AliasTable.uniform(outcomes).sample() for _ in range(50)], expected)
+
+        # Fractional weights make the table's units far larger than one 32-bit draw
+        weights = ArrayR.from_list([50 + 2.63 * i + 0.17 * (i % 3) for i in range(20)])
+        skewed = AliasTable(ArrayR.from_list(list(range(20))), weights)
+        rng = RandomStream(11)
+        counts = [0] * 20
+        for _ in range(40000):
+            counts[skewed.sample_index(rng)] += 1
+        for i in range(20):
+            self.assertAlmostEqual(counts[i] / 40000, skewed.probability(i), delta=0.006)
+
+    def test_team_goal_distribution(self):
+        """
+        #name(Test teams can have their own goal distribution)
+        """
+        shutout = self.teams[0]
+        shutout.goal_distribution = AliasTable(ArrayR.from_list([0]), ArrayR.from_list([1]))
+        self.season.simulate_season()
+        self.assertTrue(all(player.goals == 0 for player in take_out_from_adt(shutout.get_players()).to_list()))
+        self.assertGreater(sum(player.goals for player in take_out_from_adt(self.teams[1].get_players()).to_list()), 0)
+
+
+    def test_simulate_outcome(self):
+        """
+        #name(Test a game outcome records its scorers by roster position)
+        """
+        home, away = self.teams[0], self.teams[1]
+        outcome = GameSimulator.simulate(home, away)
+        self.assertFalse(hasattr(outcome, "__dict__"), "Outcomes should use __slots__")
+        self.assertEqual(len(outcome.home_scorers), outcome.home_goals)
+        self.assertEqual(len(outcome.away_scorers), outcome.away_goals)
+
+        home_outfield = take_out_from_adt(home.get_outfield_players()).to_list()
+        away_outfield = take_out_from_adt(away.get_outfield_players()).to_list()
+        scorers = outcome.scorers().to_list()
+        self.assertTrue(all(player in home_outfield for player in scorers[:outcome.home_goals]))
+        self.assertTrue(all(player in away_outfield for player in scorers[outcome.home_goals:]))
+        names = outcome.goal_scorers
+        self.assertEqual([names[i] for i in range(len(names))], [player.name for player in scorers])
+
+    def test_simulate_batch(self):
+        """
+        #name(Test a batch of games matches simulating them one at a time)
+        """
+        fixtures = self.season.schedule[0].games
+        RandomGen.set_seed(42)
+        expected = [GameSimulator.simulate(game.home_team, game.away_team) for game in fixtures]
+        RandomGen.set_seed(42)
+        batch = GameSimulator.simulate_batch(fixtures)
+
+        self.assertEqual(len(batch), len(fixtures))
+        self.assertEqual(batch.scorer_offsets[len(batch)], len(batch.scorer_ids))
+        for game, outcome in enumerate(expected):
+            self.assertEqual((batch.home_goals[game], batch.away_goals[game]), (outcome.home_goals, outcome.away_goals))
+            scorers = batch.scorer_ids[batch.scorer_offsets[game]:batch.scorer_offsets[game + 1]]
+            self.assertEqual(list(scorers), [outcome.scorer_ids[i] for i in range(len(outcome.scorer_ids))])
+            self.assertEqual(batch.outcome(game).home_goals, outcome.home_goals)
+            self.assertEqual(batch.outcome(game).scorers().to_list(), outcome.scorers().to_list())
+
+    def test_simulate_season_scoped_registry(self):
+        """
+        #name(Test seasons credit goals correctly across scoped and global player registries)
+        """
+        # Players from the global registry, simulated inside a scope
+        with scoped_registry():
+            self.season.simulate_season()
+        expected = [player.goals for team in self.teams for player in take_out_from_adt(team.get_players()).to_list()]
+        self.assertGreater(sum(expected), 0)
+
+        # Players from a scope, simulated after it ends, must not touch the global registry's players
+        with scoped_registry() as registry:
+            self.setUp()
+        global_goals = [PLAYER_REGISTRY[i].goals for i in range(len(PLAYER_REGISTRY))]
+        self.season.simulate_season()
+        scoped_goals = [player.goals for team in self.teams for player in take_out_from_adt(team.get_players()).to_list()]
+        self.assertEqual(scoped_goals, expected)
+        self.assertEqual([PLAYER_REGISTRY[i].goals for i in range(len(PLAYER_REGISTRY))], global_goals)
+        self.assertIn(self.teams[0].get_players()[0], registry)
+
+
+    def _simulate_twice(self, first_backend, second_backend, seed):
+        """
+        Simulates the season, then again from the same starting state, returning the points of both runs.
+        """
+        snapshots = [team.snapshot() for team in self.teams]
+        self.season.simulate_season(backend=first_backend, seed=seed)
+        first_points = [team.points for team in self.teams]
+        Season(ArrayR.from_list(snapshots)).simulate_season(backend=second_backend, seed=seed)
+        return first_points, [team.points for team in snapshots]
+
+    @skipUnless(season_numpy.NUMPY_AVAILABLE, "NumPy is not installed")
+    def test_simulate_season_numpy(self):
+        """
+        #name(Test the NumPy season simulation is consistent and reproducible from a seed)
+        """
+        first_points, second_points = self._simulate_twice("numpy", "numpy", 5)
+        self.assertEqual(first_points, second_points)
+
+        # Every game gives out 3 points for a win or 2 for a draw
+        game_count = len(self.teams) * (len(self.teams) - 1)
+        self.assertTrue(2 * game_count <= sum(first_points) <= 3 * game_count)
+        for team in self.teams:
+            self.assertEqual(len(team.history), min(2 * (len(self.teams) - 1), team.history.capacity))
+        self.assertGreater(sum(player.goals for team in self.teams for player in take_out_from_adt(team.get_players()).to_list()), 0)
+
+    def test_simulate_season_backend_fallback(self):
+        """
+        #name(Test the NumPy backend falls back to the Python simulation when NumPy is missing)
+        """
+        if season_numpy.NUMPY_AVAILABLE:
+            self.skipTest("NumPy is installed")
+        first_points, second_points = self._simulate_twice("numpy", "python", 9)
+        self.assertEqual(first_points, second_points)
+        self.assertRaises(ValueError, lambda: self.season.simulate_season(backend="fortran"))
+
+
+    def test_simulate_season_own_stream(self):
+        """
+        #name(Test seasons simulated with their own random stream are reproducible)
+        """
+        snapshots = [team.snapshot() for team in self.teams]
+        self.season.simulate_season(rng=RandomStream(2024))
+        points = [team.points for team in self.teams]
+
+        # Draws from the shared stream in between must not change the other season
+        rng = RandomStream(2024)
+        RandomGen.random()
+        Season(ArrayR.from_list(snapshots)).simulate_season(rng=rng)
+        self.assertEqual([team.points for team in snapshots], points)
+
+        # The class methods still use one shared stream
+        RandomGen.set_seed(1)
+        first = RandomGen.random()
+        self.assertEqual(RandomStream(1).random(), first)
+        self.assertEqual(RandomGen.seed, RandomGen.default.seed)
+        RandomGen.seed = 1
+        self.assertEqual(RandomGen.random(), first)
+
+    def test_simulate_season_on_snapshots(self):
+        """
+        #name(Test simulating a season on snapshots leaves the original teams and players untouched)
+        """
+        snapshots = [team.snapshot() for team in self.teams]
+        Season(ArrayR.from_list(snapshots)).simulate_season(seed=7)
+
+        for team in self.teams:
+            self.assertEqual(team.points, 0)
+            self.assertEqual([player.goals for player in take_out_from_adt(team.get_players()).to_list()], [0] * len(team))
+        fork_goals = [snapshot.goals_of(player) for snapshot in snapshots for player in take_out_from_adt(snapshot.get_players()).to_list()]
+        self.assertGreater(sum(fork_goals), 0)
+
+        # The same season on the original teams credits the same goals to the players themselves
+        self.season.simulate_season(seed=7)
+        self.assertEqual([player.goals for team in self.teams for player in take_out_from_adt(team.get_players()).to_list()], fork_goals)
+
+        # Forks of forks start from the goals of the fork they were taken from
+        second = snapshots[0].snapshot()
+        first_player = snapshots[0].get_players()[0]
+        self.assertEqual(second.goals_of(first_player), snapshots[0].goals_of(first_player))
+
+    def test_random_jump_and_split(self):
+        """
+        #name(Test jumping and splitting random streams)
+        """
+        stepped, jumped = RandomStream(99), RandomStream(99)
+        for _ in range(1000):
+            stepped.random()
+        jumped.jump(1000)
+        self.assertEqual(jumped.random(), stepped.random())
+
+        # Substream i is the same for any number of streams, and starts SPLIT_STRIDE * (i + 1) outputs ahead
+        parent = RandomStream(5)
+        streams = parent.split(3)
+        self.assertIsInstance(streams, ArrayR)
+        self.assertEqual([s.seed for s in RandomStream(5).split(5).to_list()[:3]], [s.seed for s in streams.to_list()])
+        self.assertEqual(parent.seed, 5)
+        ahead = RandomStream(5)
+        ahead.jump(2 * RandomGen.SPLIT_STRIDE)
+        self.assertEqual(ahead.random(), streams[1].random())
+        self.assertRaises(ValueError, lambda: RandomStream(5).jump(-1))
+        self.assertRaises(ValueError, lambda: RandomStream(5).split(-1))
+        most = RandomGen.MOD // RandomGen.SPLIT_STRIDE - 1
+        self.assertRaises(ValueError, lambda: RandomStream(5).split(most + 1))
+        # The last stream ends where the period brings the generator back to this one
+        last = RandomStream(5).split(most)[most - 1]
+        last.jump(RandomGen.SPLIT_STRIDE)
+        self.assertEqual(last.seed, 5)
+
+    def test_random_blocks(self):
+        """
+        #name(Test block draws match the same number of single draws)
+        """
+        single, block = RandomStream(31), RandomStream(31)
+        self.assertEqual(list(block.random_block(100)), [single.random() for _ in range(100)])
+        self.assertEqual(list(block.randint_block(50, -3, 7)), [single.randint(-3, 7) for _ in range(50)])
+        self.assertEqual(list(block.random_float_block(50)), [single.random_float() for _ in range(50)])
+        self.assertEqual(block.random(), single.random())
+        self.assertEqual(len(block.random_block(0)), 0)
+        self.assertRaises(ValueError, lambda: block.random_block(5, backend="fortran"))
+        self.assertIsInstance(block.random_block(5, backend="python"), array)
+        if random_gen.numpy is None:
+            self.assertIsInstance(block.random_block(5), array, "Without NumPy the default backend is Python")
+
+    @skipUnless(random_gen.numpy is not None, "NumPy is not installed")
+    def test_random_blocks_numpy(self):
+        """
+        #name(Test NumPy block draws match the Python ones)
+        """
+        python, vectorised = RandomStream(31), RandomStream(31)
+        for n in (1, 2, 7, 1000):
+            self.assertEqual(list(vectorised.random_block(n, backend="numpy")), list(python.random_block(n)))
+        self.assertEqual(list(vectorised.randint_block(50, -3, 7, backend="numpy")), list(python.randint_block(50, -3, 7)))
+        self.assertEqual(list(vectorised.random_float_block(50, backend="numpy")), list(python.random_float_block(50)))
+        self.assertEqual(vectorised.seed, python.seed)
+        self.assertIsInstance(vectorised.random_block(5), random_gen.numpy.ndarray, "With NumPy it is the default backend")
+
+    def test_random_sampling(self):
+        """
+        #name(Test shuffling and sampling arrays)
+        """
+        rng = RandomStream(8)
+        items = ArrayR.from_list(list(range(50)))
+        rng.random_shuffle(items)
+        self.assertEqual(sorted(items.to_list()), list(range(50)))
+        self.assertNotEqual(items.to_list(), list(range(50)))
+
+        chosen = rng.sample(items, 20).to_list()
+        self.assertEqual(len(set(chosen)), 20)
+        self.assertTrue(all(item in range(50) for item in chosen))
+        self.assertEqual(len(rng.sample(items, 50)), 50)
+        self.assertRaises(ValueError, lambda: rng.sample(items, 51))
+        # The work depends on k, not on the size of the collection
+        huge = rng.sample(range(10 ** 12), 5).to_list()
+        self.assertEqual(len(set(huge)), 5)
+        self.assertEqual(len(rng.sample(items, 0)), 0)
+
+        reservoir = rng.reservoir_sample(iter(range(1000)), 10)
+        self.assertEqual(len(reservoir), 10)
+        self.assertEqual(len({reservoir[i] for i in range(10)}), 10)
+        self.assertEqual(len(rng.reservoir_sample(iter(range(3)), 10)), 3)
+
+        weighted = [rng.weighted_choice(ArrayR.from_list("abc"), ArrayR.from_list([1, 0, 3])) for _ in range(400)]
+        self.assertNotIn("b", weighted)
+        self.assertGreater(weighted.count("c"), weighted.count("a"))
+        self.assertRaises(ValueError, lambda: rng.weighted_choice(ArrayR.from_list("ab"), ArrayR.from_list([0, 0])))
+
+    def test_poisson_goal_model(self):
+        """
+        #name(Test the Poisson goal model draws goals and updates ratings)
+        """
+        model = PoissonGoalModel()
+        strong, weak = self.teams[0], self.teams[1]
+        model.set_ratings(strong, 2.0, 1.0)
+        home_rate, away_rate = model.expected_goals(strong, weak)
+        self.assertAlmostEqual(home_rate, PoissonGoalModel.BASE_RATE * PoissonGoalModel.HOME_ADVANTAGE * 2.0)
+        self.assertAlmostEqual(away_rate, PoissonGoalModel.BASE_RATE)
+
+        draws = [model.draw_goals(2.0) for _ in range(5000)]
+        self.assertAlmostEqual(sum(draws) / len(draws), 2.0, delta=0.1)
+        self.assertEqual(model.draw_goals(0.0), 0)
+
+        # Scoring more than expected raises attack and lowers the opponent's defence
+        model.update(strong, weak, 6, 0)
+        self.assertGreater(model.ratings(strong)[0], 2.0)
+        self.assertLess(model.ratings(weak)[1], 1.0)
+        self.assertLess(model.ratings(weak)[0], 1.0)
+
+        self.season.simulate_season(goal_model=model)
+        self.assertEqual(len(self.teams[2].history), min(2 * (len(self.teams) - 1), self.teams[2].history.capacity))
+        self.assertNotEqual(model.ratings(self.teams[2]), (1.0, 1.0))
 
 
 class TestTask6Approach(TestTask6Setup):
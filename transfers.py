@@ -0,0 +1,147 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from data_structures.array_list import ArrayList
+from data_structures.hash_table_identity import IdentityProbeTable
+from data_structures.hash_table_linear_probing import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from player import Player
+from team import Team
+
+
+@dataclass
+class Transfer:
+    """
+    A move of `player` from `from_team` to `to_team`.
+    """
+    player: Player = None
+    from_team: Team = None
+    to_team: Team = None
+
+
+class TransferEngine:
+    POSITION_COUNT = len(PlayerPosition)
+    NO_CHANGES = array('l', bytes(POSITION_COUNT * array('l').itemsize))
+
+    @staticmethod
+    def apply(transfers: ArrayR[Transfer] | ArrayList[Transfer]) -> None:
+        """
+        Applies a batch of transfers in order.
+
+        The whole batch is checked before any team changes, so either every transfer is applied or none is.
+        A player may move more than once in a batch, as long as each move starts from the team the previous
+        move left them in. Position limits only need to hold once the whole batch has been applied, so two
+        full teams can swap players.
+        Each affected team's roster version is bumped once for the batch, so its cached views are rebuilt
+        at most once rather than after every move.
+
+        Args:
+            transfers (ArrayR[Transfer] | ArrayList[Transfer]): The transfers to apply
+
+        Raises:
+            ValueError: if a player is not in the team they leave, is already in the team they join,
+                or a team would end up with more players in a position than its limit
+
+        Complexity:
+            Best Case Complexity: O(M), where M is the number of transfers
+            Worst Case Complexity: O(M + N), where N is the number of players in the affected teams,
+                when rosters shared with a snapshot have to be copied
+        """
+        affected_teams = TransferEngine.__check(transfers)
+        for i in range(len(transfers)):
+            transfer = transfers[i]
+            transfer.from_team._detach(transfer.player)
+            transfer.to_team._attach(transfer.player)
+        for i in range(len(affected_teams)):
+            affected_teams[i].version += 1
+
+    @staticmethod
+    def validate(transfers: ArrayR[Transfer] | ArrayList[Transfer]) -> None:
+        """
+        Checks that a batch of transfers can be applied, without changing any team.
+
+        Raises:
+            ValueError: if a player is not in the team they leave, is already in the team they join,
+                or a team would end up with more players in a position than its limit
+
+        Complexity:
+            Best Case Complexity: O(M), where M is the number of transfers
+            Worst Case Complexity: O(M), same as best case
+        """
+        TransferEngine.__check(transfers)
+
+    @staticmethod
+    def __check(transfers: ArrayR[Transfer] | ArrayList[Transfer]) -> ArrayList[Team]:
+        """
+        Checks a batch of transfers as in `validate`, returning the teams the batch changes.
+        """
+        # The team each player is in after the transfers checked so far, sized so it never has to grow
+        current_teams = IdentityProbeTable(TransferEngine.__table_sizes(len(transfers)))
+        # Where each affected team's changes start in `position_changes`
+        team_indices = IdentityProbeTable()
+        teams = ArrayList()
+        # How many players each team gains (or loses) in each position over the batch,
+        # at `team index * POSITION_COUNT + position ordinal`
+        position_changes = array('l')
+        # Consecutive transfers often involve the same teams, so their indices are kept at hand
+        from_team = to_team = None
+        from_start = to_start = 0
+        for i in range(len(transfers)):
+            transfer = transfers[i]
+            player = transfer.player
+            try:
+                current_team = current_teams[player]
+                in_from_team = current_team is transfer.from_team
+                in_to_team = current_team is transfer.to_team
+            except KeyError:
+                in_from_team = player in transfer.from_team._player_slots
+                in_to_team = player in transfer.to_team._player_slots
+            if not in_from_team:
+                raise ValueError(f"Player {player.name} not found in team {transfer.from_team.name}")
+            if in_to_team or transfer.to_team is transfer.from_team:
+                raise ValueError(f"Player {player.name} is already in team {transfer.to_team.name}")
+            current_teams[player] = transfer.to_team
+            if transfer.from_team is not from_team:
+                from_team = transfer.from_team
+                from_start = TransferEngine.__team_index(team_indices, teams, position_changes, from_team)
+            if transfer.to_team is not to_team:
+                to_team = transfer.to_team
+                to_start = TransferEngine.__team_index(team_indices, teams, position_changes, to_team)
+            position_changes[from_start + player.position.ordinal] -= 1
+            position_changes[to_start + player.position.ordinal] += 1
+
+        for i in range(len(teams)):
+            team = teams[i]
+            for position in PlayerPosition:
+                change = position_changes[i * TransferEngine.POSITION_COUNT + position.ordinal]
+                if change > 0 and not team.has_room(position, change):
+                    raise ValueError(f"Team {team.name} has no room for {change} more {position.name}")
+        return teams
+
+    @staticmethod
+    def __team_index(team_indices: IdentityProbeTable[int], teams: ArrayList[Team], position_changes: array,
+                     team: Team) -> int:
+        """
+        Returns where `team`'s position changes start in `position_changes`, adding the team if it is new.
+        """
+        try:
+            return team_indices[team]
+        except KeyError:
+            start = len(teams) * TransferEngine.POSITION_COUNT
+            team_indices[team] = start
+            teams.append(team)
+            position_changes.extend(TransferEngine.NO_CHANGES)
+            return start
+
+    @staticmethod
+    def __table_sizes(count: int) -> ArrayList[int]:
+        """
+        Returns the table sizes for a table that holds up to `count` keys without ever resizing.
+        """
+        sizes = ArrayList()
+        size = LinearProbeTable.TABLE_SIZES[0]
+        while size <= 2 * count:
+            size = 2 * size + 1
+        sizes.append(size)
+        return sizes